@@ -5,20 +5,21 @@ A simple CLI tool for saving and running frequently used commands and command ch
 Enhanced version with improved UX and additional features
 """
 
+# Startup cost matters for the `ql <alias>` direct-run path, so only
+# modules that path actually touches are imported here; the heavier or
+# rarely used ones (argparse, tempfile, pyperclip, ...) load on demand.
 import os
 import sys
-import subprocess
 import json
 import re
-import argparse
-import tempfile
-import stat
+import bisect
+import select
 import time
-import glob
 import shutil
+import string
+from functools import lru_cache
 from pathlib import Path
 from collections import OrderedDict
-from datetime import datetime
 
 # Cross-platform terminal handling
 try:
@@ -35,12 +36,235 @@ except ImportError:
     MSVCRT_AVAILABLE = False
     msvcrt = None
 
-# Optional clipboard support
+# Optional clipboard support, probed on first use: False means not yet
+# probed, None means pyperclip is not installed
+_pyperclip = False
+
+
+def _get_pyperclip():
+    """Lazily import pyperclip; returns the module or None"""
+    global _pyperclip
+    if _pyperclip is False:
+        try:
+            import pyperclip
+            _pyperclip = pyperclip
+        except ImportError:
+            _pyperclip = None
+    return _pyperclip
+
+
+# Optional fast JSON (C extension); config files are parsed on every
+# startup, so the faster codec pays off as the command set grows
 try:
-    import pyperclip
-    CLIPBOARD_AVAILABLE = True
+    import orjson
 except ImportError:
-    CLIPBOARD_AVAILABLE = False
+    orjson = None
+
+
+def _json_loads(text):
+    """Parse JSON with orjson when available, stdlib json otherwise"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _json_dump_file(path, obj):
+    """Write obj to path as indented JSON in a single write call"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        # Serialize to one string first: json.dump streams hundreds of
+        # tiny f.write calls through the file object, dumps issues one
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(obj, indent=2, ensure_ascii=False))
+
+# Centralized ANSI codes, blanked when stdout is not a terminal so the
+# non-interactive path (ql <alias>, piped output) emits plain text and
+# skips escape construction entirely. The hot render paths below build
+# from these; cold paths keep their inline literals.
+_USE_COLOR = sys.stdout.isatty()
+
+
+def _c(code):
+    """Return an ANSI escape, or '' when color output is disabled"""
+    return code if _USE_COLOR else ""
+
+
+RESET = _c("\033[0m")
+CYAN = _c("\033[36m")
+BOLD_CYAN = _c("\033[1;36m")
+GREY = _c("\033[37m")
+DIM = _c("\033[90m")
+RED = _c("\033[91m")
+GREEN = _c("\033[92m")
+YELLOW = _c("\033[93m")
+BLUE = _c("\033[94m")
+MAGENTA = _c("\033[95m")
+BRIGHT_CYAN = _c("\033[96m")
+SELECTED_BG = _c("\033[1;97;44m")
+
+# Precompiled list-row templates: %-formatting reuses these constants
+# instead of rebuilding an f-string for every visible row on every frame.
+# Slots: (num, emoji, padded name, indicator, command) for the selected
+# row; the normal row adds leading number and name color codes.
+ROW_SELECTED = f"{SELECTED_BG} %s. %s %s%s → %s{RESET}"
+ROW_NORMAL = f"%s %s.{RESET} %s %s%s{DIM}%s{RESET} {GREY}→{RESET} %s"
+
+# Single-byte key classification table built once at import: one table
+# lookup replaces the isdigit/isprintable method calls per keystroke in
+# the interactive loops. Bits: 1 = control, 2 = digit, 4 = printable.
+# The digit bit is ASCII-only on purpose: it feeds int(key) in the
+# quick-select branches, and str.isdigit() also accepts characters like
+# '²' that int() rejects.
+KEY_CONTROL, KEY_DIGIT, KEY_PRINTABLE = 1, 2, 4
+_KEY_CLASS = bytearray(256)
+for _code in range(256):
+    _char = chr(_code)
+    _KEY_CLASS[_code] = ((KEY_CONTROL if _code < 0x20 else 0)
+                         | (KEY_DIGIT if '0' <= _char <= '9' else 0)
+                         | (KEY_PRINTABLE if _char.isprintable() else 0))
+del _code, _char
+
+
+def _classify_key(key):
+    """Classification bits for a key; multi-char sequences classify as 0"""
+    if len(key) == 1:
+        code = ord(key)
+        if code < 256:
+            return _KEY_CLASS[code]
+        # Non-Latin-1 printables fall back to the method call; none of
+        # them are quick-select digits
+        return KEY_PRINTABLE if key.isprintable() else 0
+    return 0
+
+
+# Execution script bodies, parsed once at import; only alias/command/
+# shell vary per launch. Shell's own $ uses are $$-escaped.
+_CHAIN_TEMPLATE = string.Template("""#!/bin/bash
+# QL Command Executor - Chain Command
+# Auto-cleanup: this script will self-destruct
+trap 'rm -f "$$0" 2>/dev/null || true' EXIT INT TERM
+
+cd /
+
+echo "🚀 Running chain: $alias"
+echo "📁 Working directory: $$(pwd)"
+echo "──────────────────────────────────────────────────"
+
+set -e
+set -o pipefail
+
+echo "⛓️  Executing chain command"
+$command
+
+echo "──────────────────────────────────────────────────"
+echo "✅ Chain '$alias' completed successfully"
+
+# Force cleanup before exec
+rm -f "$$0" 2>/dev/null || true
+
+exec $shell
+""")
+
+_LINK_TEMPLATE = string.Template("""#!/bin/bash
+# QL Command Executor
+# Auto-cleanup: this script will self-destruct
+trap 'rm -f "$$0" 2>/dev/null || true' EXIT INT TERM
+
+cd /
+
+echo "🚀 Running: $command"
+echo "📁 Working directory: $$(pwd)"
+echo "──────────────────────────────────────────────────"
+
+$command
+
+exit_code=$$?
+
+echo "──────────────────────────────────────────────────"
+if [ $$exit_code -eq 0 ]; then
+    echo "✅ Command completed successfully"
+else
+    echo "❌ Command failed with exit code $$exit_code"
+fi
+
+# Force cleanup before exec
+rm -f "$$0" 2>/dev/null || true
+
+exec $shell
+""")
+
+# Dangerous command patterns, compiled once at import. Commands get
+# re-checked on every run (dry-run, direct run, exec), so the verdict
+# is memoized per command string as well.
+DANGEROUS_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'\brm\s+-rf?\s+/',
+    r'\bshutdown\b',
+    r'\breboot\b',
+    r'\bdd\s+if=',
+    r'\bmkfs\b',
+    r'\bformat\b',
+    r'>\s*/dev/sd[a-z]',
+    r'\bsudo\b.*\brm\b',
+)]
+
+
+@lru_cache(maxsize=512)
+def _is_dangerous(command):
+    """Memoized dangerous-pattern scan for a command string"""
+    return any(p.search(command) for p in DANGEROUS_PATTERNS)
+
+
+# Help screen text is static except for the template listing, so the
+# fixed sections are joined into two blobs once at import and written
+# with single calls instead of ~40 print statements per view.
+HELP_HEAD = "\n".join([
+    "\033[96m" + "=" * 60,
+    "🚀 QL - Quick Launcher Help",
+    "=" * 60 + "\033[0m",
+    "",
+    "\033[94m📝 Adding Commands:\033[0m",
+    "\033[36m   add backup tar -czf backup.tar.gz ~/docs\033[0m",
+    "\033[37m   └─ Creates a simple command link\033[0m",
+    "",
+    "\033[36m   chain deploy git pull && npm install && npm run build\033[0m",
+    "\033[37m   └─ Creates a command chain (stops on first failure)\033[0m",
+    "",
+    "\033[36m   template backup tar -czf backup-{date}.tar.gz {directory}\033[0m",
+    "\033[37m   └─ Creates a template with placeholders for dynamic values\033[0m",
+    "",
+    "\033[94m🎯 Navigation Tips:\033[0m",
+    "\033[37m   • Use / to search/filter commands by name, description, or tags\033[0m",
+    "\033[37m   • Arrow keys to navigate, Enter to run\033[0m",
+    "\033[37m   • Numbers 1-9 for quick selection of first 9 commands\033[0m",
+    "\033[37m   • Ctrl+D for dry run preview (see what would execute)\033[0m",
+    "\033[37m   • p key to toggle command preview on/off\033[0m",
+    "",
+    "\033[94m🔧 Command Management:\033[0m",
+    "\033[37m   • edit <alias> - Modify existing commands\033[0m",
+    "\033[37m   • Commands can have descriptions and tags for better organization\033[0m",
+    "\033[37m   • Usage statistics track how often you use each command\033[0m",
+    "\033[37m   • export/import for sharing command sets between machines\033[0m",
+    "",
+    "\033[94m🎨 Template Management:\033[0m",
+    "\033[37m   • template <name> - Run saved template with dynamic placeholders\033[0m",
+    "\033[37m   • template <name> <command> - Save new template with {placeholder} syntax\033[0m",
+    "\033[37m   • template edit <name> - Modify existing templates\033[0m",
+    "\033[37m   • Templates prompt for {placeholder} values each time they run\033[0m",
+    "",
+    "\033[94m🎨 Available Templates:\033[0m",
+]) + "\n"
+
+HELP_TAIL = "\n".join([
+    "",
+    "\033[94m⚠️  Safety Features:\033[0m",
+    "\033[37m   • Potentially dangerous commands require confirmation\033[0m",
+    "\033[37m   • Common command typos are detected and corrected\033[0m",
+    "\033[37m   • Commands are validated before saving\033[0m",
+    "",
+]) + "\n"
+
 
 class UIManager:
     """Handles all UI rendering and keyboard input"""
@@ -53,8 +277,10 @@ class UIManager:
         self.filter_text = ""
         self.show_preview = True
         self.first_run = True
+        self._pending_keys = []
     
-    def safe_truncate(self, text, max_length, suffix="..."):
+    @staticmethod
+    def safe_truncate(text, max_length, suffix="..."):
         """Safely truncate text to avoid string length errors"""
         if not text:
             return ""
@@ -82,9 +308,47 @@ class UIManager:
         # Reset any terminal formatting
         print('\033[0m', end='', flush=True)
     
+    def push_key(self, key):
+        """Push a key back so the next get_key returns it"""
+        self._pending_keys.append(key)
+
+    def get_key_nowait(self):
+        """Return the next key only if input is already buffered, else None"""
+        if self._pending_keys:
+            return self._pending_keys.pop(0)
+        if not (TERMIOS_AVAILABLE and sys.stdin.isatty()):
+            return None
+        if not select.select([sys.stdin], [], [], 0)[0]:
+            return None
+        return self.get_key()
+
+    def get_key_batch(self, max_chars=64, timeout=0.001):
+        """Drain buffered printable keys (e.g. a paste) into one string.
+
+        Stops at the first non-printable key, which is pushed back for
+        the caller's next get_key. The tiny select timeout catches paste
+        characters still in flight from the terminal.
+        """
+        chars = []
+        while len(chars) < max_chars:
+            key = self.get_key_nowait()
+            if key is None:
+                if timeout and TERMIOS_AVAILABLE and sys.stdin.isatty() \
+                        and select.select([sys.stdin], [], [], timeout)[0]:
+                    continue  # more of the paste arrived within the window
+                break
+            if _classify_key(key) & KEY_PRINTABLE:
+                chars.append(key)
+            else:
+                self.push_key(key)
+                break
+        return ''.join(chars)
+
     def get_key(self):
         """Get a single keypress from terminal with cross-platform support"""
-        if TERMIOS_AVAILABLE:
+        if self._pending_keys:
+            return self._pending_keys.pop(0)
+        if TERMIOS_AVAILABLE and sys.stdin.isatty():
             # Unix/Linux/macOS
             fd = sys.stdin.fileno()
             old_settings = termios.tcgetattr(fd)
@@ -124,30 +388,33 @@ class UIManager:
             return key.decode('utf-8', errors='ignore')
         
         else:
-            # Fallback - just get regular input
-            return input().strip()
+            # Fallback - just get regular input; treat EOF like Ctrl+C so
+            # piped input exits cleanly instead of raising every iteration
+            try:
+                return input().strip()
+            except EOFError:
+                return '\x03'
     
     def fuzzy_match(self, text, pattern):
-        """Combined substring + fuzzy matching for intuitive search"""
+        """Combined substring + fuzzy matching for intuitive search.
+
+        Both arguments must already be lowercase: search blobs are
+        stored lowered and callers lower the filter text once per
+        keystroke, so no per-command string copies are made here.
+        """
         if not pattern:
             return True
-        
-        try:
-            text_str = str(text).lower()
-            pattern_str = str(pattern).lower()
-            
-            # First try substring search (most intuitive)
-            if pattern_str in text_str:
-                return True
-            
-            # Fall back to fuzzy matching (characters in order)
-            i = 0
-            for char in text_str:
-                if i < len(pattern_str) and char == pattern_str[i]:
-                    i += 1
-            return i == len(pattern_str)
-        except (ValueError, OverflowError, MemoryError):
-            return False
+
+        # First try substring search (most intuitive)
+        if pattern in text:
+            return True
+
+        # Fall back to fuzzy matching (characters in order)
+        i = 0
+        for char in text:
+            if i < len(pattern) and char == pattern[i]:
+                i += 1
+        return i == len(pattern)
     
     def show_message_and_pause(self, title, lines, wait_text="Press Enter to continue..."):
         """Display a message with clean formatting and wait for user input"""
@@ -168,21 +435,74 @@ class UIManager:
         """Get templates filtered by current filter text using fuzzy matching"""
         if not filter_text:
             return list(templates.items())
-        
+
+        pattern = filter_text.lower()
+        fuzzy = self.fuzzy_match
         filtered = []
         for name, template_data in templates.items():
-            template_command = template_data.get('template', '')
-            description = template_data.get('description', '')
-            placeholders = ' '.join(template_data.get('placeholders', []))
-            
-            if (self.fuzzy_match(name, filter_text) or 
-                self.fuzzy_match(template_command, filter_text) or
-                self.fuzzy_match(description, filter_text) or
-                self.fuzzy_match(placeholders, filter_text)):
+            blob = template_data.get('_search_blob')
+            if blob is None:
+                blob = TemplateManager.build_search_blob(name, template_data)
+                template_data['_search_blob'] = blob
+            if fuzzy(blob, pattern):
                 filtered.append((name, template_data))
         return filtered
 
 
+class PrefixTrie:
+    """Minimal character trie used for alias prefix completion"""
+
+    # Terminal marker key. Aliases aren't validated anywhere, so any
+    # character can legally appear in one; an object() sentinel can never
+    # collide with a single-character key the way a string marker could.
+    _WORD = object()
+
+    def __init__(self, words=()):
+        self.root = {}
+        for word in words:
+            self.insert(word)
+
+    def insert(self, word):
+        """Insert a word into the trie"""
+        node = self.root
+        for char in word:
+            node = node.setdefault(char, {})
+        node[self._WORD] = word  # Terminal marker holds the full word
+
+    def remove(self, word):
+        """Remove a word, pruning branches that become empty"""
+        path = []
+        node = self.root
+        for char in word:
+            if char not in node:
+                return
+            path.append((node, char))
+            node = node[char]
+        node.pop(self._WORD, None)
+        for parent, char in reversed(path):
+            if parent[char]:
+                break
+            del parent[char]
+
+    def collect(self, prefix):
+        """Return all inserted words starting with prefix, sorted"""
+        node = self.root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return []
+        matches = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            for char, child in node.items():
+                if char is self._WORD:
+                    matches.append(child)
+                else:
+                    stack.append(child)
+        return sorted(matches)
+
+
 class CommandManager:
     """Manages command CRUD operations and execution"""
     
@@ -193,6 +513,29 @@ class CommandManager:
         
         self.commands = self.load_commands()
         self.stats = self.load_stats()
+
+        # Bumped whenever the command set changes so cached filter results
+        # can be invalidated without rescanning every keystroke
+        self._commands_version = 0
+
+        # Sorted alias list for prefix completion, rebuilt lazily on change
+        self._sorted_aliases = sorted(self.commands)
+        self._sorted_aliases_version = self._commands_version
+
+        # Trie for O(prefix-length) completion on large command sets
+        self._alias_trie = PrefixTrie(self.commands)
+
+        # Read-only alias set for membership tests, rebuilt lazily
+        self._alias_set = frozenset(self.commands)
+        self._alias_set_version = self._commands_version
+
+        # Bumped whenever usage counters change (they feed the stats line)
+        self._usage_version = 0
+
+        # Precompute search blobs and display strings for everything
+        # loaded from disk
+        for alias, cmd_data in self.commands.items():
+            self.index_command(alias, cmd_data)
         
         # Common command typos
         self.common_typos = {
@@ -205,25 +548,14 @@ class CommandManager:
             'dockerrun': 'docker run'
         }
         
-        # Dangerous command patterns
-        self.dangerous_patterns = [
-            r'\brm\s+-rf?\s+/',
-            r'\bshutdown\b',
-            r'\breboot\b',
-            r'\bdd\s+if=',
-            r'\bmkfs\b',
-            r'\bformat\b',
-            r'>\s*/dev/sd[a-z]',
-            r'\bsudo\b.*\brm\b',
-        ]
-    
     def load_commands(self):
         """Load commands from config file with backward compatibility"""
+        from datetime import datetime
         commands = OrderedDict()
-        
+
         if not self.config_file.exists():
             return commands
-        
+
         try:
             with open(self.config_file, 'r', encoding='utf-8') as f:
                 content = f.read().strip()
@@ -234,7 +566,7 @@ class CommandManager:
                 # Try JSON format first
                 if content.startswith('{'):
                     try:
-                        data = json.loads(content)
+                        data = _json_loads(content)
                         # Convert to OrderedDict to maintain order and validate structure
                         for alias, cmd_data in data.items():
                             if isinstance(cmd_data, dict) and 'command' in cmd_data:
@@ -256,7 +588,8 @@ class CommandManager:
                                     "created": datetime.now().isoformat()
                                 }
                         return commands
-                    except json.JSONDecodeError:
+                    except ValueError:
+                        # Covers both json and orjson decode errors
                         pass  # Fall through to old format parsing
                 
                 # Fall back to old text format
@@ -295,33 +628,69 @@ class CommandManager:
             return stats
         
         try:
-            with open(self.stats_file, 'r', encoding='utf-8') as f:
-                stats = json.load(f)
+            with open(self.stats_file, 'rb') as f:
+                stats = _json_loads(f.read())
         except Exception:
             pass  # Use default stats if loading fails
         
         return stats
     
+    @staticmethod
+    def build_search_blob(alias, cmd_data):
+        """Build the single lowercase haystack string used by filter matching"""
+        return "\x1f".join((
+            alias,
+            cmd_data.get('command', ''),
+            cmd_data.get('description', ''),
+            ' '.join(cmd_data.get('tags', []))
+        )).lower()
+
+    def index_command(self, alias, cmd_data):
+        """Refresh the derived cache fields stored on a command dict"""
+        cmd_data['_search_blob'] = self.build_search_blob(alias, cmd_data)
+        command = cmd_data.get('command', '')
+        cmd_data['_display40'] = UIManager.safe_truncate(command, 40)
+        cmd_data['_display80'] = UIManager.safe_truncate(command, 80)
+
+    def sorted_aliases(self):
+        """Sorted alias list for prefix completion, rebuilt when stale"""
+        if self._sorted_aliases_version != self._commands_version:
+            self._sorted_aliases = sorted(self.commands)
+            self._sorted_aliases_version = self._commands_version
+        return self._sorted_aliases
+
+    def alias_set(self):
+        """Frozen alias set for membership tests, rebuilt when stale"""
+        if self._alias_set_version != self._commands_version:
+            self._alias_set = frozenset(self.commands)
+            self._alias_set_version = self._commands_version
+        return self._alias_set
+
+    def public_commands(self):
+        """Commands without internal cache fields (safe to serialize)"""
+        return {alias: {k: v for k, v in cmd_data.items() if not k.startswith('_')}
+                for alias, cmd_data in self.commands.items()}
+
     def save_commands(self):
         """Save commands to config file in JSON format"""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(dict(self.commands), f, indent=2, ensure_ascii=False)
+            _json_dump_file(self.config_file, self.public_commands())
         except (IOError, OSError) as e:
             print(f"\033[91m❌ Error saving commands: {e}\033[0m")
-    
+
     def save_stats(self):
         """Save usage statistics"""
         try:
-            with open(self.stats_file, 'w', encoding='utf-8') as f:
-                json.dump(self.stats, f, indent=2)
+            _json_dump_file(self.stats_file, self.stats)
         except Exception:
             pass  # Ignore stats save errors
     
     def update_usage_stats(self, alias):
         """Update usage statistics for a command"""
+        from datetime import datetime
         self.stats["usage_count"][alias] = self.stats["usage_count"].get(alias, 0) + 1
         self.stats["last_used"][alias] = datetime.now().isoformat()
+        self._usage_version += 1
         self.save_stats()
     
     def validate_command(self, command):
@@ -351,10 +720,7 @@ class CommandManager:
     
     def is_dangerous_command(self, command):
         """Check if command contains dangerous patterns"""
-        for pattern in self.dangerous_patterns:
-            if re.search(pattern, command, re.IGNORECASE):
-                return True
-        return False
+        return _is_dangerous(command)
     
     def add_command(self, alias, command, cmd_type='link', description="", tags=None):
         """Add a new command with enhanced features"""
@@ -400,6 +766,7 @@ class CommandManager:
             tags_input = input("\033[96mTags (comma-separated, optional): \033[0m").strip()
             tags = [tag.strip() for tag in tags_input.split(',') if tag.strip()] if tags_input else []
         
+        from datetime import datetime
         self.commands[alias] = {
             "type": cmd_type,
             "command": command,
@@ -407,8 +774,11 @@ class CommandManager:
             "tags": tags or [],
             "created": datetime.now().isoformat()
         }
+        self.index_command(alias, self.commands[alias])
+        self._alias_trie.insert(alias)
+        self._commands_version += 1
         self.save_commands()
-        
+
         emoji = "⛓️" if cmd_type == 'chain' else "🔗"
         print(f"\033[92m✅ Added {cmd_type} '{alias}' {emoji}\033[0m")
         if description:
@@ -465,6 +835,8 @@ class CommandManager:
             'description': current_description,
             'tags': current_tags
         })
+        self.index_command(alias, self.commands[alias])
+        self._commands_version += 1
         self.save_commands()
         
         emoji = "⛓️" if cmd_type == 'chain' else "🔗"
@@ -487,12 +859,15 @@ class CommandManager:
         
         if response == 'y':
             del self.commands[alias]
+            self._alias_trie.remove(alias)
             # Also remove from stats
             if alias in self.stats["usage_count"]:
                 del self.stats["usage_count"][alias]
             if alias in self.stats["last_used"]:
                 del self.stats["last_used"][alias]
-            
+
+            self._usage_version += 1
+            self._commands_version += 1
             self.save_commands()
             self.save_stats()
             print(f"\033[92m✅ Removed {cmd_type} '{alias}'\033[0m")
@@ -509,6 +884,15 @@ class TemplateManager:
         self.config_dir = config_dir
         self.templates_file = self.config_dir / '.qltemplates'
         self.templates = self.load_templates()
+
+        # Bumped whenever the template set changes so render/filter caches
+        # can tell the templates moved underneath them
+        self._templates_version = 0
+
+        # Precompute search blobs and display strings for everything
+        # loaded from disk
+        for name, template_data in self.templates.items():
+            self.index_template(name, template_data)
     
     def load_templates(self):
         """Load templates from config file, creating defaults if needed"""
@@ -539,8 +923,7 @@ class TemplateManager:
         if not self.templates_file.exists():
             # Create template file with defaults
             try:
-                with open(self.templates_file, 'w', encoding='utf-8') as f:
-                    json.dump(default_templates, f, indent=2, ensure_ascii=False)
+                _json_dump_file(self.templates_file, default_templates)
             except (IOError, OSError) as e:
                 print(f"\033[93m⚠️  Warning: Error creating template file: {e}\033[0m")
                 print(f"\033[37mUsing built-in templates.\033[0m")
@@ -553,12 +936,11 @@ class TemplateManager:
                 
                 if not content:
                     # Empty file, recreate with defaults
-                    with open(self.templates_file, 'w', encoding='utf-8') as f:
-                        json.dump(default_templates, f, indent=2, ensure_ascii=False)
+                    _json_dump_file(self.templates_file, default_templates)
                     return default_templates
-                
+
                 # Try to load JSON
-                templates = json.loads(content)
+                templates = _json_loads(content)
                 
                 # Validate structure
                 validated_templates = {}
@@ -568,27 +950,73 @@ class TemplateManager:
                 
                 if not validated_templates:
                     # No valid templates, recreate with defaults
-                    with open(self.templates_file, 'w', encoding='utf-8') as f:
-                        json.dump(default_templates, f, indent=2, ensure_ascii=False)
+                    _json_dump_file(self.templates_file, default_templates)
                     return default_templates
-                
+
                 return validated_templates
-                
-        except (IOError, OSError, json.JSONDecodeError) as e:
+
+        except (IOError, OSError, ValueError) as e:
             print(f"\033[93m⚠️  Warning: Error reading template file: {e}\033[0m")
             print(f"\033[37mRecreating with default templates.\033[0m")
             try:
-                with open(self.templates_file, 'w', encoding='utf-8') as f:
-                    json.dump(default_templates, f, indent=2, ensure_ascii=False)
+                _json_dump_file(self.templates_file, default_templates)
             except:
                 pass
             return default_templates
     
+    @staticmethod
+    def build_search_blob(name, template_data):
+        """Build the single lowercase haystack string used by filter matching"""
+        return "\x1f".join((
+            name,
+            template_data.get('template', ''),
+            template_data.get('description', ''),
+            ','.join(template_data.get('placeholders', []))
+        )).lower()
+
+    @staticmethod
+    def build_inline_preview(template_data):
+        """Build the two dim preview lines shown under the selected row"""
+        description = template_data.get('description', '')
+        placeholders = template_data.get('placeholders', [])
+
+        preview_parts = []
+        if description:
+            preview_parts.append(f"📝 {description}")
+        if placeholders:
+            placeholders_csv = template_data.get('_placeholders_csv')
+            if placeholders_csv is None:
+                placeholders_csv = ', '.join(placeholders)
+            preview_parts.append(f"🔧 Placeholders: {placeholders_csv}")
+
+        display_template = template_data.get('_display80')
+        if display_template is None:
+            display_template = UIManager.safe_truncate(template_data.get('template', ''), 80)
+
+        lines = []
+        if preview_parts:
+            lines.append(f"\033[90m   └─ {' • '.join(preview_parts)}\033[0m")
+        lines.append(f"\033[90m   └─ Template: {display_template}\033[0m")
+        return "\n".join(lines)
+
+    def index_template(self, name, template_data):
+        """Refresh the derived cache fields stored on a template dict"""
+        template_data['_search_blob'] = self.build_search_blob(name, template_data)
+        template_command = template_data.get('template', '')
+        template_data['_display40'] = UIManager.safe_truncate(template_command, 40)
+        template_data['_display80'] = UIManager.safe_truncate(template_command, 80)
+        template_data['_placeholders_csv'] = ', '.join(template_data.get('placeholders', []))
+        template_data['_inline_preview'] = self.build_inline_preview(template_data)
+
+    def public_templates(self):
+        """Templates without internal cache fields (safe to serialize)"""
+        return {name: {k: v for k, v in template_data.items() if not k.startswith('_')}
+                for name, template_data in self.templates.items()}
+
     def save_templates(self):
         """Save templates to config file"""
         try:
-            with open(self.templates_file, 'w', encoding='utf-8') as f:
-                json.dump(self.templates, f, indent=2, ensure_ascii=False)
+            _json_dump_file(self.templates_file, self.public_templates())
         except (IOError, OSError) as e:
             print(f"\033[91m❌ Error saving templates: {e}\033[0m")
     
@@ -622,8 +1050,10 @@ class TemplateManager:
             'description': description or f"Template: {name}",
             'placeholders': placeholders
         }
+        self.index_template(name, self.templates[name])
+        self._templates_version += 1
         self.save_templates()
-        
+
         placeholder_text = ""
         if placeholders:
             placeholder_text = f" with placeholders: {', '.join(placeholders)}"
@@ -671,8 +1101,10 @@ class TemplateManager:
             'description': current_description,
             'placeholders': new_placeholders
         }
+        self.index_template(name, self.templates[name])
+        self._templates_version += 1
         self.save_templates()
-        
+
         placeholder_text = ""
         if new_placeholders:
             placeholder_text = f" with placeholders: {', '.join(new_placeholders)}"
@@ -693,6 +1125,7 @@ class TemplateManager:
         
         if response == 'y':
             del self.templates[name]
+            self._templates_version += 1
             self.save_templates()
             print(f"\033[92m✅ Removed template '{name}'\033[0m")
             return True
@@ -719,6 +1152,43 @@ class QLLauncher:
         
         # Application state
         self.current_mode = 'command'  # 'command' or 'template'
+
+        # Cached filter results: (filter_text, commands_version, results),
+        # plus a lazily built {alias: row} map for the same filter state
+        self._cmd_filter_cache = (None, None, None)
+        self._cmd_filter_index = {}
+        self._cmd_filter_index_key = None
+
+        # Last UI state tuple that was actually drawn; None forces a redraw
+        self._last_rendered_state = None
+
+        # Cached stats line, invalidated when commands or usage change
+        self._stats_cache_key = None
+        self._stats_cache = ""
+
+        # Single hash lookup instead of a linear if/elif command ladder
+        self._dispatch = {
+            'quit': self._cmd_quit,
+            'q': self._cmd_quit,
+            'exit': self._cmd_quit,
+            'help': self._cmd_help,
+            'templates': self._cmd_templates,
+            'add': self._cmd_add,
+            'chain': self._cmd_chain,
+            'edit': self._cmd_edit,
+            'remove': self._cmd_remove,
+            'template': self._cmd_template,
+            'export': self._cmd_export,
+            'import': self._cmd_import,
+            'cleanup': self._cmd_cleanup,
+        }
+
+        # Terminal row where list row 0 was last drawn (None when the last
+        # frame isn't safe to patch in place, e.g. preview mode is on)
+        self._tpl_list_first_row = None
+        self._tpl_max_name_len = 0
+        self._main_list_first_row = None
+        self._main_max_alias_len = 0
     
     def reset_ui_state(self):
         """Reset UI state when switching modes"""
@@ -727,6 +1197,32 @@ class QLLauncher:
         self.ui.filter_text = ""
         self.ui.input_mode = False
         self.ui.input_buffer = ""
+        self._last_rendered_state = None
+
+    def _handle_backspace(self):
+        """Apply one backspace to whichever buffer is active"""
+        if self.ui.filter_mode:
+            if self.ui.filter_text:
+                self.ui.filter_text = self.ui.filter_text[:-1]
+                self.ui.selected_index = 0
+            else:
+                self.ui.filter_mode = False
+        elif self.ui.input_mode and self.ui.input_buffer:
+            self.ui.input_buffer = self.ui.input_buffer[:-1]
+            if not self.ui.input_buffer:
+                self.ui.input_mode = False
+
+    def _template_render_state(self):
+        """State tuple that fully determines the template screen contents"""
+        return (self.ui.selected_index, self.ui.filter_text, self.ui.input_buffer,
+                self.ui.input_mode, self.ui.filter_mode, self.ui.show_preview,
+                self.template_manager._templates_version)
+
+    def _main_render_state(self):
+        """State tuple that fully determines the main screen contents"""
+        return (self.ui.selected_index, self.ui.filter_text, self.ui.input_buffer,
+                self.ui.input_mode, self.ui.filter_mode, self.ui.show_preview,
+                self.command_manager._commands_version)
     
     def cleanup_old_scripts(self):
         """Clean up any leftover QL temp scripts"""
@@ -737,22 +1233,31 @@ class QLLauncher:
             return
             
         try:
-            pattern = str(script_dir / '*_ql.sh')
-            for script_path in glob.glob(pattern):
-                try:
-                    if os.path.exists(script_path):
-                        # Clean up scripts older than 5 minutes (more aggressive)
-                        age = time.time() - os.path.getmtime(script_path)
-                        if age > 300:  # 5 minutes
-                            with open(script_path, 'r', encoding='utf-8', errors='ignore') as f:
-                                content = f.read()
-                                if '# QL Command Executor' in content:
-                                    os.unlink(script_path)
-                                    print(f"\033[90m🧹 Cleaned up old script: {os.path.basename(script_path)}\033[0m")
-                except (OSError, IOError):
-                    pass  # Ignore individual file errors
+            # scandir gives us name + stat in one pass, no glob matching
+            cutoff = time.time() - 300  # 5 minutes (more aggressive)
+            with os.scandir(script_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('_ql.sh'):
+                        continue
+                    try:
+                        if entry.stat().st_mtime < cutoff and self._is_ql_script(entry.path):
+                            os.unlink(entry.path)
+                            print(f"\033[90m🧹 Cleaned up old script: {entry.name}\033[0m")
+                    except (OSError, IOError):
+                        pass  # Ignore individual file errors
         except (OSError, IOError):
             pass  # Ignore directory errors
+
+    @staticmethod
+    def _is_ql_script(script_path):
+        """Check the header marker to confirm a script is one of ours"""
+        # The marker sits on line 2 of generated scripts, so the first
+        # 128 bytes are enough - no need to read 10KB commands into memory
+        try:
+            with open(script_path, 'rb') as f:
+                return b'# QL Command Executor' in f.read(128)
+        except (OSError, IOError):
+            return False
     
     def show_template_list(self):
         """Interactive template management interface"""
@@ -776,12 +1281,20 @@ class QLLauncher:
         self.ui.filter_text = ""
         self.ui.input_mode = False
         self.ui.input_buffer = ""
-        
+        self._last_rendered_state = None
+
         while True:
-            self.show_template_screen()
-            
+            # Skip the full redraw when nothing visible changed (e.g. an
+            # unhandled key); branches that draw their own screens reset
+            # _last_rendered_state to force a repaint
+            state = self._template_render_state()
+            if state != self._last_rendered_state:
+                self.show_template_screen()
+                self._last_rendered_state = state
+
             try:
-                key = self.ui.get_key()
+                key = self.ui.get_key() or ''
+                key_cls = _classify_key(key)
                 display_templates = self.ui.get_filtered_templates(
                     self.template_manager.templates, 
                     self.ui.filter_text
@@ -798,6 +1311,7 @@ class QLLauncher:
                             break
                         self.ui.input_buffer = ""
                         self.ui.input_mode = False
+                        self._last_rendered_state = None
                     elif display_templates and not self.ui.input_mode:
                         # Run selected template
                         if 0 <= self.ui.selected_index < len(display_templates):
@@ -805,7 +1319,7 @@ class QLLauncher:
                             self.run_template(selected_name)
                             break
                 
-                elif key.isdigit() and not self.ui.input_mode and not self.ui.filter_mode:
+                elif key_cls & KEY_DIGIT and not self.ui.input_mode and not self.ui.filter_mode:
                     # Quick select with number keys (1-9)
                     num = int(key) - 1
                     if 0 <= num < len(display_templates) and num < 9:
@@ -819,12 +1333,14 @@ class QLLauncher:
                         selected_name = display_templates[self.ui.selected_index][0]
                         self.template_manager.edit_template(selected_name)
                         input("\033[90mPress Enter to continue...\033[0m")
+                        self._last_rendered_state = None
                 
                 elif key == 'd' and display_templates and not self.ui.input_mode and not self.ui.filter_mode:
                     # Dry run preview of selected template
                     if 0 <= self.ui.selected_index < len(display_templates):
                         selected_name = display_templates[self.ui.selected_index][0]
                         self.show_template_preview(selected_name)
+                        self._last_rendered_state = None
                 
                 elif key == 'r' and display_templates and not self.ui.input_mode and not self.ui.filter_mode:
                     # Remove selected template
@@ -840,6 +1356,7 @@ class QLLauncher:
                             if self.ui.selected_index >= len(display_templates):
                                 self.ui.selected_index = max(0, len(display_templates) - 1)
                         input("\033[90mPress Enter to continue...\033[0m")
+                        self._last_rendered_state = None
                 
                 elif key == 'n' and not self.ui.input_mode and not self.ui.filter_mode:
                     # Create new template
@@ -851,16 +1368,21 @@ class QLLauncher:
                     if 0 <= self.ui.selected_index < len(display_templates):
                         selected_name = display_templates[self.ui.selected_index][0]
                         self.copy_template_to_clipboard(selected_name)
+                        self._last_rendered_state = None
                 
                 elif key == 'p' and not self.ui.input_mode and not self.ui.filter_mode:
                     # Toggle preview
                     self.ui.show_preview = not self.ui.show_preview
                 
                 elif key == 'UP' and display_templates and not self.ui.input_mode and not self.ui.filter_mode:
-                    self.ui.selected_index = max(0, self.ui.selected_index - 1)
-                
+                    old_idx = self.ui.selected_index
+                    self.ui.selected_index = max(0, old_idx - 1)
+                    self._tpl_repaint_selection(old_idx, display_templates)
+
                 elif key == 'DOWN' and display_templates and not self.ui.input_mode and not self.ui.filter_mode:
-                    self.ui.selected_index = min(len(display_templates) - 1, self.ui.selected_index + 1)
+                    old_idx = self.ui.selected_index
+                    self.ui.selected_index = min(len(display_templates) - 1, old_idx + 1)
+                    self._tpl_repaint_selection(old_idx, display_templates)
                 
                 elif key == '/' and not self.ui.input_mode:
                     # Enter filter mode
@@ -869,17 +1391,18 @@ class QLLauncher:
                     self.ui.selected_index = 0
                 
                 elif key == '\x7f' or key == '\x08':  # Backspace
-                    if self.ui.filter_mode:
-                        if self.ui.filter_text:
-                            self.ui.filter_text = self.ui.filter_text[:-1]
-                            self.ui.selected_index = 0
+                    self._handle_backspace()
+                    # Coalesce a burst of buffered backspaces into one redraw
+                    while True:
+                        next_key = self.ui.get_key_nowait()
+                        if next_key is None:
+                            break
+                        if next_key == '\x7f' or next_key == '\x08':
+                            self._handle_backspace()
                         else:
-                            self.ui.filter_mode = False
-                    elif self.ui.input_mode and self.ui.input_buffer:
-                        self.ui.input_buffer = self.ui.input_buffer[:-1]
-                        if not self.ui.input_buffer:
-                            self.ui.input_mode = False
-                
+                            self.ui.push_key(next_key)
+                            break
+
                 elif key == '\x1b':  # Escape key
                     if self.ui.filter_mode:
                         self.ui.filter_mode = False
@@ -900,37 +1423,140 @@ class QLLauncher:
                 elif key == 'q':  # Quit
                     return False
                 
-                elif key.isprintable():
+                elif key_cls & KEY_PRINTABLE:
+                    # Batch any already-buffered printable keys (a paste
+                    # arrives one char at a time) before redrawing once
+                    batch = key + self.ui.get_key_batch()
                     if self.ui.filter_mode:
-                        self.ui.filter_text += key
+                        self.ui.filter_text += batch
                         self.ui.selected_index = 0
                     else:
                         if not self.ui.input_mode:
                             self.ui.input_mode = True
                             self.ui.input_buffer = ""
-                        self.ui.input_buffer += key
-                    
+                        self.ui.input_buffer += batch
+
             except KeyboardInterrupt:
                 return False
-            except Exception:
-                continue
-    
+
+    def _format_template_row(self, i, name, template_data, selected, max_name_len):
+        """Render one template list row (no trailing newline)"""
+        placeholders = template_data.get('placeholders', [])
+
+        # Pre-truncated at save time; fall back for entries that haven't
+        # been through index_template yet
+        display_template = template_data.get('_display40')
+        if display_template is None:
+            display_template = self.ui.safe_truncate(template_data.get('template', ''), 40)
+
+        # Show number for quick selection (1-9)
+        if i < 9:
+            num_display = f"{i+1}"
+        else:
+            num_display = f"{i+1:2d}" if i < 99 else "##"
+
+        # Placeholder indicator
+        placeholder_indicator = f" [{len(placeholders)}]" if placeholders else ""
+
+        if selected:
+            return ROW_SELECTED % (num_display, "🎨", name.ljust(max_name_len),
+                                   placeholder_indicator, display_template)
+
+        # Show clickable numbers (1-9) in bright color, others in dim
+        num_color = BRIGHT_CYAN if i < 9 else DIM
+        return ROW_NORMAL % (num_color, num_display, "🎨", CYAN,
+                             name.ljust(max_name_len), placeholder_indicator,
+                             display_template)
+
+    def _format_command_row(self, i, alias, cmd_data, selected, max_alias_len):
+        """Render one command list row (no trailing newline)"""
+        cmd_type = cmd_data.get('type', 'link')
+        usage_count = self.command_manager.stats["usage_count"].get(alias, 0)
+
+        # Choose emoji based on type
+        emoji = "⛓️" if cmd_type == 'chain' else "🔗"
+
+        # Pre-truncated at save time; fall back for entries that haven't
+        # been through index_command yet
+        display_command = cmd_data.get('_display40')
+        if display_command is None:
+            display_command = self.ui.safe_truncate(cmd_data.get('command', ''), 40)
+
+        # Show number for quick selection (1-9), or position for 10+
+        if i < 9:
+            num_display = f"{i+1}"
+        else:
+            num_display = f"{i+1:2d}" if i < 99 else "##"
+
+        # Add usage indicator
+        usage_indicator = f" ({usage_count})" if usage_count > 0 else ""
+
+        if selected:
+            return ROW_SELECTED % (num_display, emoji, alias.ljust(max_alias_len),
+                                   usage_indicator, display_command)
+
+        # Show clickable numbers (1-9) in bright color, others in dim
+        num_color = BRIGHT_CYAN if i < 9 else DIM
+        alias_color = BOLD_CYAN if usage_count > 0 else CYAN
+        return ROW_NORMAL % (num_color, num_display, emoji, alias_color,
+                             alias.ljust(max_alias_len), usage_indicator,
+                             display_command)
+
+    def _repaint_rows(self, indexes, display_items, first_row, max_len, formatter):
+        """Rewrite just the given list rows in place instead of a full redraw"""
+        out = ["\0337"]  # Save cursor
+        for i in indexes:
+            name, data = display_items[i]
+            line = formatter(i, name, data, i == self.ui.selected_index, max_len)
+            out.append(f"\033[{first_row + i};1H\033[2K{line}")
+        out.append("\0338")  # Restore cursor
+        sys.stdout.write(''.join(out))
+        sys.stdout.flush()
+
+    def _tpl_repaint_selection(self, old_idx, display_templates):
+        """Incrementally repaint the two rows affected by a selection move.
+
+        Returns after patching the screen and marking the frame rendered;
+        falls back to a no-op (full redraw happens next loop) when the last
+        frame can't be patched in place.
+        """
+        new_idx = self.ui.selected_index
+        if (new_idx == old_idx or self.ui.show_preview or
+                self._tpl_list_first_row is None):
+            return
+        self._repaint_rows([old_idx, new_idx], display_templates,
+                           self._tpl_list_first_row, self._tpl_max_name_len,
+                           self._format_template_row)
+        self._last_rendered_state = self._template_render_state()
+
+    def _main_repaint_selection(self, old_idx, display_commands):
+        """Incrementally repaint the two rows affected by a selection move"""
+        new_idx = self.ui.selected_index
+        if (new_idx == old_idx or self.ui.show_preview or
+                self._main_list_first_row is None):
+            return
+        self._repaint_rows([old_idx, new_idx], display_commands,
+                           self._main_list_first_row, self._main_max_alias_len,
+                           self._format_command_row)
+        self._last_rendered_state = self._main_render_state()
+
     def show_template_screen(self):
         """Display the interactive template management screen"""
         self.ui.clear_screen()
-        
-        # Header
-        print("\033[96m" + "=" * 60)
+
+        # Header (rows 1-4: three header lines plus one blank)
+        print(BRIGHT_CYAN + "=" * 60)
         print("🎨 Template Management")
-        print("=" * 60 + "\033[0m")
+        print("=" * 60 + RESET)
         print()
-        
+
         # Get templates to display (filtered or all)
         display_templates = self.ui.get_filtered_templates(
-            self.template_manager.templates, 
+            self.template_manager.templates,
             self.ui.filter_text
         )
-        
+
+        self._tpl_list_first_row = None
         if not self.template_manager.templates:
             print("\033[94m📝 No templates saved yet!\033[0m")
             print("\033[37mGet started by creating your first template:\033[0m")
@@ -941,9 +1567,9 @@ class QLLauncher:
             # Show filter status and stats
             template_count = len(self.template_manager.templates)
             if self.ui.filter_mode:
-                print(f"\033[94m🔍 Filter: \"{self.ui.filter_text}\" ({len(display_templates)}/{template_count} templates)\033[0m")
+                print(f"{BLUE}🔍 Filter: \"{self.ui.filter_text}\" ({len(display_templates)}/{template_count} templates){RESET}")
             else:
-                print(f"\033[94m📊 {template_count} templates available\033[0m")
+                print(f"{BLUE}📊 {template_count} templates available{RESET}")
             print()
             
             if not display_templates:
@@ -951,33 +1577,23 @@ class QLLauncher:
             else:
                 # Calculate max name length for alignment
                 max_name_len = max(len(name) for name, _ in display_templates) if display_templates else 10
-                
+
+                # List row 0 lands on terminal row 7 (header + status lines),
+                # but \033[row;1H addresses the visible viewport, so only
+                # enable in-place repaints when the whole frame fits the
+                # terminal without scrolling. footer_rows counts every print
+                # below the list on this branch.
+                footer_rows = 16 + (1 if _get_pyperclip() is not None else 0)
+                frame_rows = 6 + len(display_templates) + footer_rows
+                if frame_rows <= shutil.get_terminal_size().lines:
+                    self._tpl_list_first_row = 7
+                    self._tpl_max_name_len = max_name_len
+
                 for i, (name, template_data) in enumerate(display_templates):
-                    template_command = template_data.get('template', '')
-                    description = template_data.get('description', '')
-                    placeholders = template_data.get('placeholders', [])
-                    
-                    # Truncate long templates for display with safe handling
-                    display_template = self.ui.safe_truncate(template_command, 40)
-                    
-                    # Show number for quick selection (1-9)
-                    if i < 9:
-                        num_display = f"{i+1}"
-                    else:
-                        num_display = f"{i+1:2d}" if i < 99 else "##"
-                    
-                    # Placeholder indicator
-                    placeholder_indicator = f" [{len(placeholders)}]" if placeholders else ""
-                    
-                    # Highlight selected template
-                    if i == self.ui.selected_index:
-                        print(f"\033[1;97;44m {num_display}. 🎨 {name:<{max_name_len}}{placeholder_indicator} → {display_template}\033[0m")
-                        if self.ui.show_preview:
-                            self.show_template_preview_inline(name, template_data)
-                    else:
-                        # Show clickable numbers (1-9) in bright color, others in dim
-                        num_color = "\033[96m" if i < 9 else "\033[90m"
-                        print(f"{num_color} {num_display}.\033[0m 🎨 \033[36m{name:<{max_name_len}}\033[90m{placeholder_indicator}\033[0m \033[37m→\033[0m {display_template}")
+                    selected = i == self.ui.selected_index
+                    print(self._format_template_row(i, name, template_data, selected, max_name_len))
+                    if selected and self.ui.show_preview:
+                        self.show_template_preview_inline(name, template_data)
         
         print()
         print("\033[94m🎨 Template Actions:\033[0m")
@@ -987,7 +1603,7 @@ class QLLauncher:
         print("\033[36m   d\033[0m                         \033[37m- Preview selected template\033[0m")
         print("\033[36m   r\033[0m                         \033[37m- Remove selected template\033[0m")
         print("\033[36m   n\033[0m                         \033[37m- Create new template\033[0m")
-        if CLIPBOARD_AVAILABLE:
+        if _get_pyperclip() is not None:
             print("\033[36m   c\033[0m                         \033[37m- Copy template to clipboard\033[0m")
         print("\033[36m   /\033[0m                         \033[37m- Filter templates\033[0m")
         print("\033[36m   p\033[0m                         \033[37m- Toggle preview on/off\033[0m")
@@ -1000,30 +1616,19 @@ class QLLauncher:
         
         # Input prompt
         if self.ui.filter_mode:
-            print(f"\033[95m🔍 Filter: {self.ui.filter_text}\033[7m \033[0m")
+            print(f"{MAGENTA}🔍 Filter: {self.ui.filter_text}\033[7m {RESET}")
         elif self.ui.input_mode:
-            print(f"\033[96m> {self.ui.input_buffer}\033[7m \033[0m")
+            print(f"{BRIGHT_CYAN}> {self.ui.input_buffer}\033[7m {RESET}")
         else:
-            print("\033[96m> \033[0m", end="", flush=True)
-    
+            print(f"{BRIGHT_CYAN}> {RESET}", end="", flush=True)
+
     def show_template_preview_inline(self, name, template_data):
         """Show inline preview of selected template"""
-        description = template_data.get('description', '')
-        placeholders = template_data.get('placeholders', [])
-        
-        preview_parts = []
-        if description:
-            preview_parts.append(f"📝 {description}")
-        if placeholders:
-            preview_parts.append(f"🔧 Placeholders: {', '.join(placeholders)}")
-        
-        if preview_parts:
-            print(f"\033[90m   └─ {' • '.join(preview_parts)}\033[0m")
-        
-        # Show template command preview with safe handling
-        template_command = template_data.get('template', '')
-        display_template = self.ui.safe_truncate(template_command, 80)
-        print(f"\033[90m   └─ Template: {display_template}\033[0m")
+        # Precomputed at save time; fall back for unindexed entries
+        preview = template_data.get('_inline_preview')
+        if preview is None:
+            preview = TemplateManager.build_inline_preview(template_data)
+        print(preview)
     
     def show_template_preview(self, name):
         """Show full preview of selected template"""
@@ -1055,7 +1660,8 @@ class QLLauncher:
     
     def copy_template_to_clipboard(self, name):
         """Copy template to clipboard"""
-        if not CLIPBOARD_AVAILABLE:
+        pyperclip = _get_pyperclip()
+        if pyperclip is None:
             self.ui.clear_screen()
             print()
             print("\033[91m❌ Clipboard support not available (install pyperclip)\033[0m")
@@ -1086,17 +1692,18 @@ class QLLauncher:
         """Parse and execute template input commands"""
         if not user_input.strip():
             return True
-        
-        parts = user_input.strip().split()
+
+        # maxsplit keeps the template text intact instead of re-joining it
+        parts = user_input.strip().split(None, 2)
         command = parts[0].lower()
-        
+
         if command == 'new':
             if len(parts) < 3:
                 print("\033[91m❌ Usage: new <name> <template_command>\033[0m")
                 input("\033[90mPress Enter to continue...\033[0m")
             else:
                 name = parts[1]
-                template_command = ' '.join(parts[2:])
+                template_command = parts[2]
                 self.template_manager.save_template(name, template_command)
                 input("\033[90mPress Enter to continue...\033[0m")
         else:
@@ -1146,17 +1753,61 @@ class QLLauncher:
         print(f"\033[90mExecuting: {final_command}\033[0m")
         self.run_direct_command(final_command)
     
+    @staticmethod
+    def _is_trivial_command(command):
+        """One-line commands small enough to hand straight to bash -c"""
+        return '\n' not in command and len(command) < 4000
+
+    @staticmethod
+    def _inline_link_wrapper(command, shell):
+        """bash -c body with _LINK_TEMPLATE's banner/exit-code/exec-shell
+        flow, minus the self-destruct a temp script needs"""
+        return (
+            'cd /\n'
+            f'echo "🚀 Running: {command}"\n'
+            'echo "📁 Working directory: $(pwd)"\n'
+            'echo "──────────────────────────────────────────────────"\n'
+            f'{command}\n'
+            'exit_code=$?\n'
+            'echo "──────────────────────────────────────────────────"\n'
+            'if [ $exit_code -eq 0 ]; then\n'
+            '    echo "✅ Command completed successfully"\n'
+            'else\n'
+            '    echo "❌ Command failed with exit code $exit_code"\n'
+            'fi\n'
+            f'exec {shell}\n'
+        )
+
     def run_direct_command(self, command):
         """Execute a command directly without saving"""
+        if self._is_trivial_command(command):
+            # Simple one-liners skip the temp-script write/chmod/cleanup
+            # round trip and exec bash -c directly, keeping the same
+            # banner and completion report the script path prints
+            sys.stdout.flush()
+            os.write(1, "\033[2J\033[H\033[96m🚀 Executing command...\033[0m\n".encode('utf-8'))
+
+            shell = os.environ.get('SHELL', '/bin/bash')
+            if not os.path.exists(shell):
+                shell = '/bin/bash'
+
+            try:
+                os.execv('/bin/bash', ['/bin/bash', '-c', self._inline_link_wrapper(command, shell)])
+            except (OSError, IOError) as e:
+                print(f"\033[91m❌ Error executing command: {e}\033[0m")
+                input("\033[90mPress Enter to continue...\033[0m")
+            return
+
         # Create and execute script similar to run_command_and_exit but don't save
         script_path = self._create_execution_script("direct", command, 'link')
         if not script_path:
             return
-        
-        # Clear screen and launch
-        self.ui.clear_screen()
-        print(f"\033[96m🚀 Executing command...\033[0m")
-        
+
+        # Clear screen and launch: a raw write replaces the buffered
+        # prints (and clear_screen's os.system fork) right before execv
+        sys.stdout.flush()
+        os.write(1, "\033[2J\033[H\033[96m🚀 Executing command...\033[0m\n".encode('utf-8'))
+
         # Replace current process with the script
         try:
             os.execv('/bin/bash', ['/bin/bash', script_path])
@@ -1177,25 +1828,66 @@ class QLLauncher:
     
     def get_filtered_commands(self):
         """Get commands filtered by current filter text using fuzzy matching"""
-        if not self.ui.filter_text:
-            return list(self.command_manager.commands.items())
-        
-        filtered = []
-        for alias, cmd_data in self.command_manager.commands.items():
-            command = cmd_data.get('command', '')
-            description = cmd_data.get('description', '')
-            tags = ' '.join(cmd_data.get('tags', []))
-            
-            if (self.ui.fuzzy_match(alias, self.ui.filter_text) or 
-                self.ui.fuzzy_match(command, self.ui.filter_text) or
-                self.ui.fuzzy_match(description, self.ui.filter_text) or
-                self.ui.fuzzy_match(tags, self.ui.filter_text)):
-                filtered.append((alias, cmd_data))
+        filter_text = self.ui.filter_text
+        version = self.command_manager._commands_version
+        cached_text, cached_version, cached_results = self._cmd_filter_cache
+
+        # Same filter against the same command set - reuse the cached list
+        if cached_version == version and cached_text == filter_text:
+            return cached_results
+
+        if not filter_text:
+            filtered = list(self.command_manager.commands.items())
+        else:
+            # If the new filter just extends the old one (typing another
+            # character), only the previous matches can still match
+            if (cached_version == version and cached_text and
+                    filter_text.startswith(cached_text)):
+                candidates = cached_results
+            else:
+                candidates = self.command_manager.commands.items()
+
+            pattern = filter_text.lower()
+            fuzzy = self.ui.fuzzy_match
+            filtered = []
+            for alias, cmd_data in candidates:
+                blob = cmd_data.get('_search_blob')
+                if blob is None:
+                    blob = CommandManager.build_search_blob(alias, cmd_data)
+                    cmd_data['_search_blob'] = blob
+                if fuzzy(blob, pattern):
+                    filtered.append((alias, cmd_data))
+
+        self._cmd_filter_cache = (filter_text, version, filtered)
         return filtered
-    
+
+    def filtered_index_of(self, alias):
+        """O(1) row lookup of an alias in the current filtered list"""
+        filtered = self.get_filtered_commands()
+        key = self._cmd_filter_cache[:2]
+        if self._cmd_filter_index_key != key:
+            self._cmd_filter_index = {a: i for i, (a, _) in enumerate(filtered)}
+            self._cmd_filter_index_key = key
+        return self._cmd_filter_index.get(alias, 0)
+
+
     def get_command_suggestions(self, partial):
         """Get command suggestions for tab completion"""
-        matches = [alias for alias in self.command_manager.commands if alias.startswith(partial)]
+        # For large command sets walk the trie: O(prefix length + matches).
+        # For small ones the sorted-list scan below beats the pointer
+        # chasing, so keep the dict/list as the source of truth there.
+        if len(self.command_manager.commands) >= 32:
+            return self.command_manager._alias_trie.collect(partial)
+
+        # Binary search into the sorted alias list, then take the
+        # contiguous run of prefix matches: O(log N + k) per Tab press
+        aliases = self.command_manager.sorted_aliases()
+        lo = bisect.bisect_left(aliases, partial)
+        matches = []
+        for alias in aliases[lo:]:
+            if not alias.startswith(partial):
+                break
+            matches.append(alias)
         return matches
     
     def show_command_preview(self, alias):
@@ -1219,39 +1911,51 @@ class QLLauncher:
                 print(f"\033[90m   └─ {' • '.join(preview_parts)}\033[0m")
             
             # Show command preview with safe truncation
-            display_command = self.ui.safe_truncate(command, 80)
+            display_command = cmd_data.get('_display80')
+            if display_command is None:
+                display_command = self.ui.safe_truncate(command, 80)
             print(f"\033[90m   └─ Command: {display_command}\033[0m")
     
     def show_stats(self):
         """Show command usage statistics"""
         if not self.command_manager.commands:
             return ""
-        
+
+        # Both scans below only change on explicit actions, not keystrokes
+        key = (self.command_manager._commands_version,
+               self.command_manager._usage_version)
+        if key == self._stats_cache_key:
+            return self._stats_cache
+
         chains = sum(1 for cmd in self.command_manager.commands.values() if cmd.get('type') == 'chain')
         links = len(self.command_manager.commands) - chains
         total_usage = sum(self.command_manager.stats["usage_count"].values())
-        
+
         stats_text = f"📊 {len(self.command_manager.commands)} commands ({links} links, {chains} chains)"
         if total_usage > 0:
             stats_text += f" • {total_usage} total uses"
-        
+
+        self._stats_cache_key = key
+        self._stats_cache = stats_text
         return stats_text
     
     def show_main_screen(self):
         """Display the main interface"""
-        if not self.ui.first_run:
+        screen_cleared = not self.ui.first_run
+        if screen_cleared:
             self.ui.clear_screen()
         self.ui.first_run = False
-        
-        # Header with blue theme
-        print("\033[96m" + "=" * 60)
+
+        # Header with blue theme (rows 1-4: three header lines plus one blank)
+        print(BRIGHT_CYAN + "=" * 60)
         print("🚀 QL - Quick Launcher")
-        print("=" * 60 + "\033[0m")
+        print("=" * 60 + RESET)
         print()
-        
+
         # Get commands to display (filtered or all)
         display_commands = self.get_filtered_commands()
-        
+
+        self._main_list_first_row = None
         if not self.command_manager.commands:
             print("\033[94m📝 No commands saved yet!\033[0m")
             print("\033[37mGet started by adding your first command:\033[0m")
@@ -1270,9 +1974,9 @@ class QLLauncher:
             # Show filter status and stats
             stats_text = self.show_stats()
             if self.ui.filter_mode:
-                print(f"\033[94m🔍 Filter: \"{self.ui.filter_text}\" ({len(display_commands)}/{len(self.command_manager.commands)} commands)\033[0m")
+                print(f"{BLUE}🔍 Filter: \"{self.ui.filter_text}\" ({len(display_commands)}/{len(self.command_manager.commands)} commands){RESET}")
             else:
-                print(f"\033[94m{stats_text}\033[0m")
+                print(f"{BLUE}{stats_text}{RESET}")
             print()
             
             if not display_commands:
@@ -1280,38 +1984,24 @@ class QLLauncher:
             else:
                 # Calculate max alias length for alignment
                 max_alias_len = max(len(alias) for alias, _ in display_commands) if display_commands else 10
-                
+
+                # List row 0 lands on terminal row 7 (header + status lines),
+                # but only when this frame started from a cleared screen and
+                # fits the terminal: \033[row;1H addresses the visible
+                # viewport, so a frame tall enough to scroll would leave the
+                # in-place repaint rewriting the wrong lines. footer_rows
+                # counts every print below the list on this branch.
+                footer_rows = 24 + (1 if _get_pyperclip() is not None else 0)
+                frame_rows = 6 + len(display_commands) + footer_rows
+                if screen_cleared and frame_rows <= shutil.get_terminal_size().lines:
+                    self._main_list_first_row = 7
+                    self._main_max_alias_len = max_alias_len
+
                 for i, (alias, cmd_data) in enumerate(display_commands):
-                    cmd_type = cmd_data.get('type', 'link')
-                    command = cmd_data.get('command', '')
-                    description = cmd_data.get('description', '')
-                    usage_count = self.command_manager.stats["usage_count"].get(alias, 0)
-                    
-                    # Choose emoji based on type
-                    emoji = "⛓️" if cmd_type == 'chain' else "🔗"
-                    
-                    # Truncate long commands for display with safe handling
-                    display_command = self.ui.safe_truncate(command, 40)
-                    
-                    # Show number for quick selection (1-9), or position for 10+
-                    if i < 9:
-                        num_display = f"{i+1}"
-                    else:
-                        num_display = f"{i+1:2d}" if i < 99 else "##"
-                    
-                    # Add usage indicator
-                    usage_indicator = f" ({usage_count})" if usage_count > 0 else ""
-                    
-                    # Highlight selected command
-                    if i == self.ui.selected_index:
-                        print(f"\033[1;97;44m {num_display}. {emoji} {alias:<{max_alias_len}}{usage_indicator} → {display_command}\033[0m")
-                        if self.ui.show_preview:
-                            self.show_command_preview(alias)
-                    else:
-                        # Show clickable numbers (1-9) in bright color, others in dim
-                        num_color = "\033[96m" if i < 9 else "\033[90m"
-                        alias_color = "\033[1;36m" if usage_count > 0 else "\033[36m"
-                        print(f"{num_color} {num_display}.\033[0m {emoji} {alias_color}{alias:<{max_alias_len}}\033[90m{usage_indicator}\033[0m \033[37m→\033[0m {display_command}")
+                    selected = i == self.ui.selected_index
+                    print(self._format_command_row(i, alias, cmd_data, selected, max_alias_len))
+                    if selected and self.ui.show_preview:
+                        self.show_command_preview(alias)
         
         print()
         print("\033[94m⚡ Commands:\033[0m")
@@ -1332,7 +2022,7 @@ class QLLauncher:
             print("\033[36m   ↑/↓ arrows\033[0m                \033[37m- Navigate all commands\033[0m")
             print("\033[36m   Enter\033[0m                     \033[37m- Run selected command\033[0m")
             print("\033[36m   Ctrl+D\033[0m                    \033[37m- Dry run (preview command)\033[0m")
-            if CLIPBOARD_AVAILABLE:
+            if _get_pyperclip() is not None:
                 print("\033[36m   Ctrl+Y\033[0m                    \033[37m- Copy command to clipboard\033[0m")
             print("\033[36m   /\033[0m                         \033[37m- Filter commands (fuzzy)\033[0m")
             print("\033[36m   Tab\033[0m                       \033[37m- Auto-complete alias\033[0m")
@@ -1344,208 +2034,180 @@ class QLLauncher:
         
         # Input prompt
         if self.ui.filter_mode:
-            print(f"\033[95m🔍 Filter: {self.ui.filter_text}\033[7m \033[0m")
+            print(f"{MAGENTA}🔍 Filter: {self.ui.filter_text}\033[7m {RESET}")
         elif self.ui.input_mode:
-            print(f"\033[96m> {self.ui.input_buffer}\033[7m \033[0m")
+            print(f"{BRIGHT_CYAN}> {self.ui.input_buffer}\033[7m {RESET}")
         else:
-            print("\033[96m> \033[0m", end="", flush=True)
-    
+            print(f"{BRIGHT_CYAN}> {RESET}", end="", flush=True)
+
     def move_command_to_front(self, alias):
         """Move recently used command to front of the list"""
         if alias in self.command_manager.commands:
-            cmd_data = self.command_manager.commands.pop(alias)
-            new_commands = OrderedDict()
-            new_commands[alias] = cmd_data
-            new_commands.update(self.command_manager.commands)
-            self.command_manager.commands = new_commands
+            # O(1) pointer relink on the OrderedDict vs rebuilding the
+            # whole dict on every command run
+            self.command_manager.commands.move_to_end(alias, last=False)
+            # Reordering changes display order, so cached filter results
+            # keyed on the version counter must not be reused
+            self.command_manager._commands_version += 1
     
     def show_help(self):
         """Show detailed help"""
         self.ui.clear_screen()
-        print("\033[96m" + "=" * 60)
-        print("🚀 QL - Quick Launcher Help")
-        print("=" * 60 + "\033[0m")
-        print()
-        
-        print("\033[94m📝 Adding Commands:\033[0m")
-        print("\033[36m   add backup tar -czf backup.tar.gz ~/docs\033[0m")
-        print("\033[37m   └─ Creates a simple command link\033[0m")
-        print()
-        print("\033[36m   chain deploy git pull && npm install && npm run build\033[0m")
-        print("\033[37m   └─ Creates a command chain (stops on first failure)\033[0m")
-        print()
-        print("\033[36m   template backup tar -czf backup-{date}.tar.gz {directory}\033[0m")
-        print("\033[37m   └─ Creates a template with placeholders for dynamic values\033[0m")
-        print()
-        
-        print("\033[94m🎯 Navigation Tips:\033[0m")
-        print("\033[37m   • Use / to search/filter commands by name, description, or tags\033[0m")
-        print("\033[37m   • Arrow keys to navigate, Enter to run\033[0m")
-        print("\033[37m   • Numbers 1-9 for quick selection of first 9 commands\033[0m")
-        print("\033[37m   • Ctrl+D for dry run preview (see what would execute)\033[0m")
-        print("\033[37m   • p key to toggle command preview on/off\033[0m")
-        print()
-        
-        print("\033[94m🔧 Command Management:\033[0m")
-        print("\033[37m   • edit <alias> - Modify existing commands\033[0m")
-        print("\033[37m   • Commands can have descriptions and tags for better organization\033[0m")
-        print("\033[37m   • Usage statistics track how often you use each command\033[0m")
-        print("\033[37m   • export/import for sharing command sets between machines\033[0m")
-        print()
-        
-        print("\033[94m🎨 Template Management:\033[0m")
-        print("\033[37m   • template <name> - Run saved template with dynamic placeholders\033[0m")
-        print("\033[37m   • template <name> <command> - Save new template with {placeholder} syntax\033[0m")
-        print("\033[37m   • template edit <name> - Modify existing templates\033[0m")
-        print("\033[37m   • Templates prompt for {placeholder} values each time they run\033[0m")
-        print()
-        
-        print("\033[94m🎨 Available Templates:\033[0m")
+        sys.stdout.write(HELP_HEAD)
+
         if self.template_manager.templates:
+            lines = []
             for name, template in self.template_manager.templates.items():
                 placeholders = template.get('placeholders', [])
                 placeholder_text = ""
                 if placeholders:
                     placeholder_text = f" ({', '.join(placeholders)})"
-                print(f"\033[36m   {name:<15}\033[0m \033[37m{template['description']}\033[90m{placeholder_text}\033[0m")
+                lines.append(f"\033[36m   {name:<15}\033[0m \033[37m{template['description']}\033[90m{placeholder_text}\033[0m")
+            sys.stdout.write("\n".join(lines) + "\n")
         else:
-            print("\033[90m   No templates saved yet\033[0m")
-        print()
-        
-        print("\033[94m⚠️  Safety Features:\033[0m")
-        print("\033[37m   • Potentially dangerous commands require confirmation\033[0m")
-        print("\033[37m   • Common command typos are detected and corrected\033[0m")
-        print("\033[37m   • Commands are validated before saving\033[0m")
-        print()
-        
+            sys.stdout.write("\033[90m   No templates saved yet\033[0m\n")
+
+        sys.stdout.write(HELP_TAIL)
+        sys.stdout.flush()
+
         input("\033[90mPress Enter to continue...\033[0m")
     
-    def parse_input(self, user_input):
-        """Parse and execute user input"""
-        if not user_input.strip():
-            return True
-        
-        parts = user_input.strip().split()
-        command = parts[0].lower()
-        
-        if command in ['quit', 'q', 'exit']:
-            return False
-        elif command == 'help':
-            self.show_help()
-        elif command == 'templates':
+    def _cmd_quit(self, parts):
+        return False
+
+    def _cmd_help(self, parts):
+        self.show_help()
+        return True
+
+    def _cmd_templates(self, parts):
+        self.show_template_list()
+        input("\033[90mPress Enter to continue...\033[0m")
+        return True
+
+    def _add_command_from_parts(self, parts, cmd_type, usage):
+        """Shared body of the add/chain commands"""
+        if len(parts) < 3:
+            print(f"\033[91m❌ Usage: {usage}\033[0m")
+            input("\033[90mPress Enter to continue...\033[0m")
+        else:
+            alias = parts[1]
+            cmd = parts[2]
+            success = self.command_manager.add_command(alias, cmd, cmd_type)
+            if success:
+                # Reset selection to new command
+                self.ui.selected_index = self.filtered_index_of(alias)
+            input("\033[90mPress Enter to continue...\033[0m")
+        return True
+
+    def _cmd_add(self, parts):
+        return self._add_command_from_parts(parts, 'link', "add <alias> <command>")
+
+    def _cmd_chain(self, parts):
+        return self._add_command_from_parts(parts, 'chain', "chain <alias> <cmd1> && <cmd2> && <cmd3>")
+
+    def _cmd_edit(self, parts):
+        if len(parts) < 2:
+            print("\033[91m❌ Usage: edit <alias>\033[0m")
+            input("\033[90mPress Enter to continue...\033[0m")
+        else:
+            self.command_manager.edit_command(parts[1])
+            input("\033[90mPress Enter to continue...\033[0m")
+        return True
+
+    def _cmd_remove(self, parts):
+        if len(parts) < 2:
+            print("\033[91m❌ Usage: remove <alias>\033[0m")
+            input("\033[90mPress Enter to continue...\033[0m")
+        else:
+            success = self.command_manager.remove_command(parts[1])
+            if success:
+                # Adjust selection if needed
+                display_commands = self.get_filtered_commands()
+                if self.ui.selected_index >= len(display_commands):
+                    self.ui.selected_index = max(0, len(display_commands) - 1)
+            input("\033[90mPress Enter to continue...\033[0m")
+        return True
+
+    def _cmd_template(self, parts):
+        if len(parts) == 1:
+            # template - show available templates
             self.show_template_list()
             input("\033[90mPress Enter to continue...\033[0m")
-        elif command == 'add':
-            if len(parts) < 3:
-                print("\033[91m❌ Usage: add <alias> <command>\033[0m")
-                input("\033[90mPress Enter to continue...\033[0m")
-            else:
-                alias = parts[1]
-                cmd = ' '.join(parts[2:])
-                success = self.command_manager.add_command(alias, cmd, 'link')
-                if success:
-                    # Reset selection to new command
-                    display_commands = self.get_filtered_commands()
-                    for i, (cmd_alias, _) in enumerate(display_commands):
-                        if cmd_alias == alias:
-                            self.ui.selected_index = i
-                            break
-                input("\033[90mPress Enter to continue...\033[0m")
-        elif command == 'chain':
-            if len(parts) < 3:
-                print("\033[91m❌ Usage: chain <alias> <cmd1> && <cmd2> && <cmd3>\033[0m")
-                input("\033[90mPress Enter to continue...\033[0m")
-            else:
-                alias = parts[1]
-                cmd = ' '.join(parts[2:])
-                success = self.command_manager.add_command(alias, cmd, 'chain')
-                if success:
-                    # Reset selection to new command
-                    display_commands = self.get_filtered_commands()
-                    for i, (cmd_alias, _) in enumerate(display_commands):
-                        if cmd_alias == alias:
-                            self.ui.selected_index = i
-                            break
-                input("\033[90mPress Enter to continue...\033[0m")
-        elif command == 'edit':
-            if len(parts) < 2:
-                print("\033[91m❌ Usage: edit <alias>\033[0m")
-                input("\033[90mPress Enter to continue...\033[0m")
-            else:
-                self.command_manager.edit_command(parts[1])
-                input("\033[90mPress Enter to continue...\033[0m")
-        elif command == 'remove':
-            if len(parts) < 2:
-                print("\033[91m❌ Usage: remove <alias>\033[0m")
-                input("\033[90mPress Enter to continue...\033[0m")
-            else:
-                success = self.command_manager.remove_command(parts[1])
-                if success:
-                    # Adjust selection if needed
-                    display_commands = self.get_filtered_commands()
-                    if self.ui.selected_index >= len(display_commands):
-                        self.ui.selected_index = max(0, len(display_commands) - 1)
-                input("\033[90mPress Enter to continue...\033[0m")
-        elif command == 'template':
-            if len(parts) == 1:
-                # template - show available templates
-                self.show_template_list()
-                input("\033[90mPress Enter to continue...\033[0m")
-            elif len(parts) == 2:
-                # template backup - run existing template
-                self.run_template(parts[1])
-                input("\033[90mPress Enter to continue...\033[0m")
-            elif len(parts) >= 3:
-                if parts[1] == 'edit':
-                    # template edit backup
-                    if len(parts) == 3:
-                        self.template_manager.edit_template(parts[2])
-                    else:
-                        print("\033[91m❌ Usage: template edit <name>\033[0m")
-                    input("\033[90mPress Enter to continue...\033[0m")
-                elif parts[1] == 'remove':
-                    # template remove backup
-                    if len(parts) == 3:
-                        self.template_manager.remove_template(parts[2])
-                    else:
-                        print("\033[91m❌ Usage: template remove <name>\033[0m")
-                    input("\033[90mPress Enter to continue...\033[0m")
+        elif len(parts) == 2:
+            # template backup - run existing template
+            self.run_template(parts[1])
+            input("\033[90mPress Enter to continue...\033[0m")
+        else:
+            if parts[1] == 'edit':
+                # template edit backup (the tail must be a single name)
+                if len(parts[2].split()) == 1:
+                    self.template_manager.edit_template(parts[2])
                 else:
-                    # template backup tar -czf backup-{date}.tar.gz
-                    template_name = parts[1]
-                    template_command = ' '.join(parts[2:])
-                    self.template_manager.save_template(template_name, template_command)
-                    input("\033[90mPress Enter to continue...\033[0m")
-        elif command == 'export':
-            if len(parts) < 2:
-                print("\033[91m❌ Usage: export <filename>\033[0m")
-                input("\033[90mPress Enter to continue...\033[0m")
-            else:
-                self.export_commands(parts[1])
+                    print("\033[91m❌ Usage: template edit <name>\033[0m")
                 input("\033[90mPress Enter to continue...\033[0m")
-        elif command == 'import':
-            if len(parts) < 2:
-                print("\033[91m❌ Usage: import <filename>\033[0m")
+            elif parts[1] == 'remove':
+                # template remove backup
+                if len(parts[2].split()) == 1:
+                    self.template_manager.remove_template(parts[2])
+                else:
+                    print("\033[91m❌ Usage: template remove <name>\033[0m")
                 input("\033[90mPress Enter to continue...\033[0m")
             else:
-                self.import_commands(parts[1])
+                # template backup tar -czf backup-{date}.tar.gz
+                template_name = parts[1]
+                template_command = parts[2]
+                self.template_manager.save_template(template_name, template_command)
                 input("\033[90mPress Enter to continue...\033[0m")
-        elif command == 'cleanup':
-            cleaned = self.force_cleanup_all_scripts()
-            if cleaned > 0:
-                print(f"\033[92m✅ Cleaned up {cleaned} temporary script(s)\033[0m")
-            else:
-                print("\033[90m✨ No temporary scripts to clean\033[0m")
+        return True
+
+    def _cmd_export(self, parts):
+        if len(parts) < 2:
+            print("\033[91m❌ Usage: export <filename>\033[0m")
             input("\033[90mPress Enter to continue...\033[0m")
         else:
-            # Try to run as a command alias
-            if command in self.command_manager.commands:
-                return self.run_command_and_exit(command)
-            else:
-                print(f"\033[91m❌ Unknown command: {command}\033[0m")
-                print("\033[37mType 'help' for available commands or 'quit' to exit.\033[0m")
-                input("\033[90mPress Enter to continue...\033[0m")
-        
+            self.export_commands(parts[1])
+            input("\033[90mPress Enter to continue...\033[0m")
+        return True
+
+    def _cmd_import(self, parts):
+        if len(parts) < 2:
+            print("\033[91m❌ Usage: import <filename>\033[0m")
+            input("\033[90mPress Enter to continue...\033[0m")
+        else:
+            self.import_commands(parts[1])
+            input("\033[90mPress Enter to continue...\033[0m")
+        return True
+
+    def _cmd_cleanup(self, parts):
+        cleaned = self.force_cleanup_all_scripts()
+        if cleaned > 0:
+            print(f"\033[92m✅ Cleaned up {cleaned} temporary script(s)\033[0m")
+        else:
+            print("\033[90m✨ No temporary scripts to clean\033[0m")
+        input("\033[90mPress Enter to continue...\033[0m")
+        return True
+
+    def parse_input(self, user_input):
+        """Parse and execute user input"""
+        if not user_input.strip():
+            return True
+
+        # maxsplit keeps the command tail as one string, so handlers that
+        # need it verbatim (add/chain/template) skip the ' '.join rebuild
+        parts = user_input.strip().split(None, 2)
+        command = parts[0].lower()
+
+        handler = self._dispatch.get(command)
+        if handler:
+            return handler(parts)
+
+        # Try to run as a command alias
+        if command in self.command_manager.alias_set():
+            return self.run_command_and_exit(command)
+
+        print(f"\033[91m❌ Unknown command: {command}\033[0m")
+        print("\033[37mType 'help' for available commands or 'quit' to exit.\033[0m")
+        input("\033[90mPress Enter to continue...\033[0m")
         return True
     
     def force_cleanup_all_scripts(self):
@@ -1557,20 +2219,19 @@ class QLLauncher:
             
         cleaned = 0
         try:
-            pattern = str(script_dir / '*_ql.sh')
-            for script_path in glob.glob(pattern):
-                try:
-                    if os.path.exists(script_path):
-                        with open(script_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            content = f.read()
-                            if '# QL Command Executor' in content:
-                                os.unlink(script_path)
-                                cleaned += 1
-                except (OSError, IOError):
-                    pass
+            with os.scandir(script_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('_ql.sh'):
+                        continue
+                    try:
+                        if self._is_ql_script(entry.path):
+                            os.unlink(entry.path)
+                            cleaned += 1
+                    except (OSError, IOError):
+                        pass
         except (OSError, IOError):
             pass
-        
+
         return cleaned
     
     def _check_sudo_cd_issues(self, command):
@@ -1628,6 +2289,8 @@ class QLLauncher:
     
     def _create_execution_script(self, alias, command, cmd_type):
         """Create the execution script and return its path"""
+        import stat
+        import tempfile
         try:
             script_dir = self.config_dir / 'tmp'
             script_dir.mkdir(exist_ok=True)
@@ -1657,60 +2320,8 @@ class QLLauncher:
     
     def _generate_script_content(self, alias, command, cmd_type, shell):
         """Generate the script content"""
-        if cmd_type == 'chain':
-            return f"""#!/bin/bash
-# QL Command Executor - Chain Command
-# Auto-cleanup: this script will self-destruct
-trap 'rm -f "$0" 2>/dev/null || true' EXIT INT TERM
-
-cd /
-
-echo "🚀 Running chain: {alias}"
-echo "📁 Working directory: $(pwd)"
-echo "──────────────────────────────────────────────────"
-
-set -e
-set -o pipefail
-
-echo "⛓️  Executing chain command"
-{command}
-
-echo "──────────────────────────────────────────────────"
-echo "✅ Chain '{alias}' completed successfully"
-
-# Force cleanup before exec
-rm -f "$0" 2>/dev/null || true
-
-exec {shell}
-"""
-        else:
-            return f"""#!/bin/bash
-# QL Command Executor
-# Auto-cleanup: this script will self-destruct
-trap 'rm -f "$0" 2>/dev/null || true' EXIT INT TERM
-
-cd /
-
-echo "🚀 Running: {command}"
-echo "📁 Working directory: $(pwd)"
-echo "──────────────────────────────────────────────────"
-
-{command}
-
-exit_code=$?
-
-echo "──────────────────────────────────────────────────"
-if [ $exit_code -eq 0 ]; then
-    echo "✅ Command completed successfully"
-else
-    echo "❌ Command failed with exit code $exit_code"
-fi
-
-# Force cleanup before exec
-rm -f "$0" 2>/dev/null || true
-
-exec {shell}
-"""
+        tmpl = _CHAIN_TEMPLATE if cmd_type == 'chain' else _LINK_TEMPLATE
+        return tmpl.substitute(alias=alias, command=command, shell=shell)
     
     def run_command_and_exit(self, alias):
         """Run command by feeding it directly to the terminal - simplified version"""
@@ -1749,17 +2360,40 @@ exec {shell}
         # Check for sudo cd issues
         if self._check_sudo_cd_issues(command):
             return True
-        
+
+        # Trivial links skip the temp-script write/chmod/cleanup round
+        # trip and exec an equivalent inline wrapper with the same
+        # banner/exit-code/exec-shell flow; chains keep the script path
+        # for its trap-based self-destruct and set -e semantics
+        if cmd_type == 'link' and self._is_trivial_command(command):
+            shell = os.environ.get('SHELL', '/bin/bash')
+            if not os.path.exists(shell):
+                shell = '/bin/bash'
+
+            wrapper = self._inline_link_wrapper(command, shell)
+
+            sys.stdout.flush()
+            os.write(1, f"\033[2J\033[H\033[96m🚀 Launching 🔗 {alias} in terminal...\033[0m\n".encode('utf-8'))
+
+            try:
+                os.execv('/bin/bash', ['/bin/bash', '-c', wrapper])
+            except (OSError, IOError) as e:
+                print(f"\033[91m❌ Error executing command: {e}\033[0m")
+                input("\033[90mPress Enter to continue...\033[0m")
+                return True
+            return False
+
         # Create and execute script
         script_path = self._create_execution_script(alias, command, cmd_type)
         if not script_path:
             return True
         
-        # Clear screen and launch
-        self.ui.clear_screen()
+        # Clear screen and launch: one raw write, no TextIO buffering or
+        # clear_screen fork right before the address space is replaced
         emoji = "⛓️" if cmd_type == 'chain' else "🔗"
-        print(f"\033[96m🚀 Launching {emoji} {alias} in terminal...\033[0m")
-        
+        sys.stdout.flush()
+        os.write(1, f"\033[2J\033[H\033[96m🚀 Launching {emoji} {alias} in terminal...\033[0m\n".encode('utf-8'))
+
         # Replace current process with the script
         try:
             os.execv('/bin/bash', ['/bin/bash', script_path])
@@ -1809,7 +2443,8 @@ exec {shell}
     
     def copy_to_clipboard(self, alias):
         """Copy command to clipboard"""
-        if not CLIPBOARD_AVAILABLE:
+        pyperclip = _get_pyperclip()
+        if pyperclip is None:
             self.ui.clear_screen()
             print()
             print("\033[91m❌ Clipboard support not available (install pyperclip)\033[0m")
@@ -1848,11 +2483,19 @@ exec {shell}
     
     def command_interactive_mode(self):
         """Interactive mode for commands"""
+        self._last_rendered_state = None
         while True:
-            self.show_main_screen()
-            
+            # Skip the full redraw when nothing visible changed (e.g. an
+            # unhandled key); branches that draw their own screens reset
+            # _last_rendered_state to force a repaint
+            state = self._main_render_state()
+            if state != self._last_rendered_state:
+                self.show_main_screen()
+                self._last_rendered_state = state
+
             try:
-                key = self.ui.get_key()
+                key = self.ui.get_key() or ''
+                key_cls = _classify_key(key)
                 display_commands = self.get_filtered_commands()
                 
                 if key == '\r' or key == '\n':  # Enter key
@@ -1865,12 +2508,14 @@ exec {shell}
                             return False
                         self.ui.input_buffer = ""
                         self.ui.input_mode = False
+                        self._last_rendered_state = None
                     elif display_commands and not self.ui.input_mode:
                         # Run selected command
                         if 0 <= self.ui.selected_index < len(display_commands):
                             selected_alias = display_commands[self.ui.selected_index][0]
                             if not self.run_command_and_exit(selected_alias):
                                 return False
+                            self._last_rendered_state = None
                 
                 elif key == '\t' and self.ui.input_mode:  # Tab completion
                     suggestions = self.get_command_suggestions(self.ui.input_buffer)
@@ -1882,36 +2527,44 @@ exec {shell}
                         if len(suggestions) > 5:
                             print(f"\033[90m... and {len(suggestions) - 5} more\033[0m")
                         input("\033[90mPress Enter to continue...\033[0m")
+                        self._last_rendered_state = None
                 
-                elif key.isdigit() and not self.ui.input_mode and not self.ui.filter_mode:
+                elif key_cls & KEY_DIGIT and not self.ui.input_mode and not self.ui.filter_mode:
                     # Quick select with number keys (1-9)
                     num = int(key) - 1
                     if 0 <= num < len(display_commands) and num < 9:
                         selected_alias = display_commands[num][0]
                         if not self.run_command_and_exit(selected_alias):
                             return False
+                        self._last_rendered_state = None
                 
                 elif key == 'p' and not self.ui.input_mode and not self.ui.filter_mode:
                     # Toggle preview
                     self.ui.show_preview = not self.ui.show_preview
                 
                 elif key == 'UP' and display_commands and not self.ui.input_mode and not self.ui.filter_mode:
-                    self.ui.selected_index = max(0, self.ui.selected_index - 1)
-                
+                    old_idx = self.ui.selected_index
+                    self.ui.selected_index = max(0, old_idx - 1)
+                    self._main_repaint_selection(old_idx, display_commands)
+
                 elif key == 'DOWN' and display_commands and not self.ui.input_mode and not self.ui.filter_mode:
-                    self.ui.selected_index = min(len(display_commands) - 1, self.ui.selected_index + 1)
+                    old_idx = self.ui.selected_index
+                    self.ui.selected_index = min(len(display_commands) - 1, old_idx + 1)
+                    self._main_repaint_selection(old_idx, display_commands)
                 
                 elif key == '\x04' and display_commands and not self.ui.input_mode and not self.ui.filter_mode:
                     # Ctrl+D - Dry run selected command
                     if 0 <= self.ui.selected_index < len(display_commands):
                         selected_alias = display_commands[self.ui.selected_index][0]
                         self.dry_run_command(selected_alias)
+                        self._last_rendered_state = None
                 
                 elif key == '\x19' and display_commands and not self.ui.input_mode and not self.ui.filter_mode:
                     # Ctrl+Y - Copy selected command
                     if 0 <= self.ui.selected_index < len(display_commands):
                         selected_alias = display_commands[self.ui.selected_index][0]
                         self.copy_to_clipboard(selected_alias)
+                        self._last_rendered_state = None
                 
                 elif key == '/' and not self.ui.input_mode:
                     # Enter filter mode
@@ -1920,16 +2573,7 @@ exec {shell}
                     self.ui.selected_index = 0
                 
                 elif key == '\x7f' or key == '\x08':  # Backspace
-                    if self.ui.filter_mode:
-                        if self.ui.filter_text:
-                            self.ui.filter_text = self.ui.filter_text[:-1]
-                            self.ui.selected_index = 0
-                        else:
-                            self.ui.filter_mode = False
-                    elif self.ui.input_mode and self.ui.input_buffer:
-                        self.ui.input_buffer = self.ui.input_buffer[:-1]
-                        if not self.ui.input_buffer:
-                            self.ui.input_mode = False
+                    self._handle_backspace()
                 
                 elif key == '\x1b':  # Escape key
                     if self.ui.filter_mode:
@@ -1948,47 +2592,49 @@ exec {shell}
                     self.reset_ui_state()
                     return True
                 
-                elif key.isprintable():
+                elif key_cls & KEY_PRINTABLE:
+                    # Same paste batching as the template loop: append the
+                    # whole burst, then fall through to a single redraw
+                    batch = key + self.ui.get_key_batch()
                     if self.ui.filter_mode:
-                        self.ui.filter_text += key
+                        self.ui.filter_text += batch
                         self.ui.selected_index = 0
                     else:
                         if not self.ui.input_mode:
                             self.ui.input_mode = True
                             self.ui.input_buffer = ""
-                        self.ui.input_buffer += key
-                    
+                        self.ui.input_buffer += batch
+
             except KeyboardInterrupt:
                 return False
-            except Exception:
-                continue
-    
+
     def export_commands(self, filename):
         """Export commands to a file"""
+        from datetime import datetime
         try:
             export_data = {
-                'commands': dict(self.command_manager.commands),
+                'commands': self.command_manager.public_commands(),
                 'exported_at': datetime.now().isoformat(),
                 'version': '1.0.0'
             }
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
-            
+            _json_dump_file(filename, export_data)
+
             print(f"\033[92m✅ Exported {len(self.command_manager.commands)} commands to {filename}\033[0m")
         except Exception as e:
             print(f"\033[91m❌ Export failed: {e}\033[0m")
     
     def import_commands(self, filename):
         """Import commands from a file"""
+        from datetime import datetime
         if not os.path.exists(filename):
             print(f"\033[91m❌ File '{filename}' not found!\033[0m")
             return
         
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
+            with open(filename, 'rb') as f:
+                data = _json_loads(f.read())
+
             # Handle both new export format and old format
             if 'commands' in data:
                 imported_commands = data['commands']
@@ -1997,11 +2643,9 @@ exec {shell}
             
             print(f"\033[94mImporting {len(imported_commands)} commands from {filename}\033[0m")
             
-            conflicts = []
-            for alias in imported_commands:
-                if alias in self.command_manager.commands:
-                    conflicts.append(alias)
-            
+            # Hash-based keys intersection beats a per-alias membership loop
+            conflicts = list(imported_commands.keys() & self.command_manager.commands.keys())
+
             if conflicts:
                 print(f"\033[93m⚠️  {len(conflicts)} commands already exist: {', '.join(conflicts[:5])}")
                 if len(conflicts) > 5:
@@ -2011,8 +2655,10 @@ exec {shell}
                     print("\033[37mImport cancelled.\033[0m")
                     return
             
-            # Import commands
+            # Import commands; defaults are built once instead of three
+            # setdefault calls (and datetime.now) per entry
             imported_count = 0
+            now = datetime.now().isoformat()
             for alias, cmd_data in imported_commands.items():
                 # Ensure proper structure
                 if isinstance(cmd_data, str):
@@ -2021,17 +2667,18 @@ exec {shell}
                         "command": cmd_data,
                         "description": "",
                         "tags": [],
-                        "created": datetime.now().isoformat()
+                        "created": now
                     }
                 elif isinstance(cmd_data, dict):
                     # Fill in missing fields
-                    cmd_data.setdefault("description", "")
-                    cmd_data.setdefault("tags", [])
-                    cmd_data.setdefault("created", datetime.now().isoformat())
-                
+                    cmd_data = {"description": "", "tags": [], "created": now, **cmd_data}
+
+                self.command_manager.index_command(alias, cmd_data)
+                self.command_manager._alias_trie.insert(alias)
                 self.command_manager.commands[alias] = cmd_data
                 imported_count += 1
-            
+
+            self.command_manager._commands_version += 1
             self.command_manager.save_commands()
             print(f"\033[92m✅ Imported {imported_count} commands successfully\033[0m")
             
@@ -2039,6 +2686,7 @@ exec {shell}
             print(f"\033[91m❌ Import failed: {e}\033[0m")
 
 def main():
+    import argparse
     parser = argparse.ArgumentParser(
         description='QL - Quick Launcher',
         epilog='Run without arguments for interactive mode'
@@ -4,233 +4,333 @@ Comprehensive test script for QL (Quick Launcher)
 Tests all major functionality to ensure no crashes or errors
 """
 
+import asyncio
+import atexit
+import contextlib
+import io
 import os
+import py_compile
 import sys
 import tempfile
 import shutil
 import json
-import subprocess
+from collections import namedtuple
 from pathlib import Path
 
-def run_command(cmd, timeout=5):
-    """Run a command and return stdout, stderr, and return code"""
+# All test sandboxes live under one shared parent, on tmpfs when
+# available so the file-heavy tests run against RAM; a single recursive
+# cleanup at exit replaces seven per-test rmtree walks
+_SHARED_TMP = tempfile.mkdtemp(
+    prefix='ql_tests_',
+    dir='/dev/shm' if os.access('/dev/shm', os.W_OK) else None)
+atexit.register(shutil.rmtree, _SHARED_TMP, ignore_errors=True)
+
+# Resolved once; every subprocess test launches the same interpreter on
+# the same script, so there's no point re-joining the path per test.
+# Children import ql instead of executing the script path: running
+# "python ql.py" re-parses the source every time, while importing hits
+# the __pycache__ .pyc that main() warms with py_compile before the
+# suite starts.
+_PY = sys.executable
+_QL_DIR = os.getcwd()
+_QL_PATH = os.path.join(_QL_DIR, 'ql.py')
+
+# Static fixture files; copyfile into a sandbox uses the kernel's
+# copy_file_range path instead of building dicts and re-serializing
+_FIXTURES = Path(__file__).resolve().parent / 'tests' / 'fixtures'
+_QL_ARGV = [_PY, '-c',
+            'import sys; sys.path.insert(0, %r); import ql; ql.main()' % _QL_DIR]
+
+# os.environ is a proxy over the C environment; snapshot it to a plain
+# dict once so each sandbox pays for a cheap dict copy instead of six
+# proxy walks
+_BASE_ENV = dict(os.environ)
+
+@contextlib.contextmanager
+def test_sandbox():
+    """Per-test home dir with the config skeleton and env pre-built.
+
+    Yields (tmp_dir, env) where env points HOME at the sandbox. Cleanup
+    is deferred to the shared parent's atexit rmtree, so leaving the
+    context does no filesystem work at all.
+    """
+    tmp_dir = tempfile.mkdtemp(dir=_SHARED_TMP)
+    (Path(tmp_dir) / '.local' / 'bin').mkdir(parents=True)
+    yield tmp_dir, dict(_BASE_ENV, HOME=tmp_dir)
+
+# Match ql.py's optional fast-JSON codec for fixture files
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def write_json_fixture(path, obj):
+    """Write a fixture dict as JSON with whichever codec ql.py uses"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj))
+    else:
+        with open(path, 'w') as f:
+            f.write(json.dumps(obj))
+
+# The 10 KB long-command fixture is encoded and written once per run,
+# then hardlinked into each sandbox that needs it (one inode bump
+# instead of a fresh build + write). Living under _SHARED_TMP keeps it
+# on the same filesystem as the sandboxes, so link() cannot fail with
+# a cross-device error.
+_LONG_CMD_FIXTURE = Path(_SHARED_TMP) / 'long_cmd.json'
+
+def long_cmd_fixture():
+    """Path to the shared long-command fixture, built on first use"""
+    if not _LONG_CMD_FIXTURE.exists():
+        write_json_fixture(_LONG_CMD_FIXTURE, {
+            'long-cmd': {
+                'type': 'link',
+                'command': "a" * 10000,  # Very long command
+                'description': 'Very long command for testing',
+                'tags': ['test'],
+                'created': '2023-01-01T00:00:00'
+            }
+        })
+    return _LONG_CMD_FIXTURE
+
+def run_inline(args):
+    """Run ql's entry point in this process, returning (stdout, stderr, code).
+
+    Flag-only invocations like --help/--version exit inside argparse and
+    never exec a shell or touch the keyboard, so they don't need a fresh
+    interpreter per call - importing ql once amortizes the startup cost.
+    """
+    import ql
+    out = io.StringIO()
+    saved_argv = sys.argv
+    sys.argv = ['ql.py'] + list(args)
+    code = 0
+    try:
+        with contextlib.redirect_stdout(out):
+            ql.main()
+    except SystemExit as e:
+        code = e.code or 0
+    finally:
+        sys.argv = saved_argv
+    return out.getvalue(), "", code
+
+# Every child run comes back as one of these; field access in the
+# assertions reads better than positional unpacking and the helpers
+# below can take the whole result
+CommandResult = namedtuple('CommandResult', ['stdout', 'stderr', 'code'])
+
+# Sentinel code for a child killed at its deadline, so callers test the
+# code field instead of scanning stderr for a magic string
+EXIT_TIMEOUT = -2
+
+def ok(result):
+    """Whether a run counts as graceful for the crash-hunting tests.
+
+    Clean exit, a visible quit prompt, or a timeout waiting on the
+    interactive loop are all fine; anything else is a real failure.
+    """
+    return (result.code == 0
+            or result.code == EXIT_TIMEOUT
+            or b"quit" in result.stdout)
+
+async def arun_command(argv, stdin=b"", timeout=5, cwd=None, env=None):
+    """Run a command and return a CommandResult.
+
+    Takes an argv list and feeds stdin up front - no /bin/sh, no echo
+    pipeline, one fork+exec per call. close_fds=False skips the
+    /proc/self/fd walk; the children don't inherit anything sensitive.
+    The event loop multiplexes the pipes, so callers can gather several
+    children and overlap their startup latency. Output stays as bytes;
+    assertions search it directly and only decode in failure messages.
+    """
     try:
-        result = subprocess.run(
-            cmd, 
-            shell=True, 
-            capture_output=True, 
-            text=True, 
-            timeout=timeout
+        proc = await asyncio.create_subprocess_exec(
+            *argv,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
+            env=env,
+            close_fds=False
         )
-        return result.stdout, result.stderr, result.returncode
-    except subprocess.TimeoutExpired:
-        return "", "TIMEOUT", -1
     except Exception as e:
-        return "", str(e), -1
+        return CommandResult(b"", str(e).encode(), -1)
+    try:
+        stdout, stderr = await asyncio.wait_for(
+            proc.communicate(stdin), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.communicate()
+        return CommandResult(b"", b"TIMEOUT", EXIT_TIMEOUT)
+    return CommandResult(stdout, stderr, proc.returncode)
 
-def test_basic_functionality():
+async def test_basic_functionality():
     """Test basic QL functionality"""
     print("🧪 Testing basic functionality...")
     
     # Test help
-    stdout, stderr, code = run_command("python3 ql.py --help")
+    stdout, stderr, code = run_inline(["--help"])
     assert code == 0, f"Help command failed: {stderr}"
     assert "QL - Quick Launcher" in stdout, "Help output missing title"
-    
+
     # Test version
-    stdout, stderr, code = run_command("python3 ql.py --version")
+    stdout, stderr, code = run_inline(["--version"])
     assert code == 0, f"Version command failed: {stderr}"
     assert "ql 2.0.0" in stdout, "Version output incorrect"
     
     print("✅ Basic functionality tests passed")
 
-def test_command_operations():
+async def test_command_operations():
     """Test command add/remove/edit operations"""
     print("🧪 Testing command operations...")
     
     # Create temporary config directory
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        config_dir = Path(tmp_dir) / '.local' / 'bin'
-        config_dir.mkdir(parents=True)
-        
-        # Set up environment to use temp config
-        env = os.environ.copy()
-        env['HOME'] = tmp_dir
-        
-        # Test adding a command via direct execution
-        test_cmd = f'cd {tmp_dir} && python3 {os.getcwd()}/ql.py'
-        
+    with test_sandbox() as (tmp_dir, env):
         # Test that script doesn't crash when run with no commands
-        stdout, stderr, code = run_command(f"echo 'quit' | {test_cmd}")
+        result = await arun_command(_QL_ARGV, stdin=b"quit\n", cwd=tmp_dir, env=env)
         # Accept timeout as OK since interactive mode might be waiting
-        assert "No commands saved yet" in stdout or code == 0 or "TIMEOUT" in stderr, f"Empty state failed: {stderr}"
+        assert b"No commands saved yet" in result.stdout or ok(result), f"Empty state failed: {result.stderr.decode(errors='replace')}"
         
         print("✅ Command operations tests passed")
 
-def test_template_operations():
+async def test_template_operations():
     """Test template functionality"""
     print("🧪 Testing template operations...")
     
-    with tempfile.TemporaryDirectory() as tmp_dir:
+    with test_sandbox() as (tmp_dir, env):
         config_dir = Path(tmp_dir) / '.local' / 'bin'
-        config_dir.mkdir(parents=True)
-        
-        # Create a templates file with test data
+
+        # Copy in the canned templates fixture
         templates_file = config_dir / '.qltemplates'
-        test_templates = {
-            'test-template': {
-                'template': 'echo {message}',
-                'description': 'Test template',
-                'placeholders': ['message']
-            }
-        }
-        
-        with open(templates_file, 'w') as f:
-            json.dump(test_templates, f)
+        shutil.copyfile(_FIXTURES / 'templates.json', templates_file)
         
         # Test that templates load without error
-        env = os.environ.copy()
-        env['HOME'] = tmp_dir
-        
-        test_cmd = f'cd {tmp_dir} && python3 {os.getcwd()}/ql.py'
-        stdout, stderr, code = run_command(f"echo 'quit' | {test_cmd}")
-        
+        result = await arun_command(_QL_ARGV, stdin=b"quit\n", cwd=tmp_dir, env=env)
+
         # Should not crash even with template data
-        assert code == 0 or "quit" in stdout or "TIMEOUT" in stderr, f"Template loading failed: {stderr}"
+        assert ok(result), f"Template loading failed: {result.stderr.decode(errors='replace')}"
         
         print("✅ Template operations tests passed")
 
-def test_edge_cases():
+async def test_edge_cases():
     """Test edge cases and potential problem areas"""
     print("🧪 Testing edge cases...")
     
-    with tempfile.TemporaryDirectory() as tmp_dir:
+    with test_sandbox() as (tmp_dir, env):
         config_dir = Path(tmp_dir) / '.local' / 'bin'
-        config_dir.mkdir(parents=True)
-        
+
         # Test with very long command data
         commands_file = config_dir / '.qlcom'
-        long_command = "a" * 10000  # Very long command
-        test_commands = {
-            'long-cmd': {
-                'type': 'link',
-                'command': long_command,
-                'description': 'Very long command for testing',
-                'tags': ['test'],
-                'created': '2023-01-01T00:00:00'
-            }
-        }
-        
-        with open(commands_file, 'w') as f:
-            json.dump(test_commands, f)
+        os.link(long_cmd_fixture(), commands_file)
         
         # Test that long commands don't crash the display
-        env = os.environ.copy()
-        env['HOME'] = tmp_dir
-        
-        test_cmd = f'cd {tmp_dir} && python3 {os.getcwd()}/ql.py'
-        stdout, stderr, code = run_command(f"echo 'quit' | {test_cmd}")
-        
+        result = await arun_command(_QL_ARGV, stdin=b"quit\n", cwd=tmp_dir, env=env)
+
         # Should handle long commands gracefully
-        assert code == 0 or "quit" in stdout or "TIMEOUT" in stderr, f"Long command handling failed: {stderr}"
-        assert "RangeError" not in stderr and "Invalid string length" not in stderr, "String length error detected"
+        assert ok(result), f"Long command handling failed: {result.stderr.decode(errors='replace')}"
+        assert b"RangeError" not in result.stderr and b"Invalid string length" not in result.stderr, "String length error detected"
         
         print("✅ Edge cases tests passed")
 
-def test_file_operations():
+async def test_file_operations():
     """Test file I/O operations"""
     print("🧪 Testing file operations...")
     
-    with tempfile.TemporaryDirectory() as tmp_dir:
+    with test_sandbox() as (tmp_dir, env):
         config_dir = Path(tmp_dir) / '.local' / 'bin'
-        config_dir.mkdir(parents=True)
-        
+
         # Test with malformed JSON
         commands_file = config_dir / '.qlcom'
-        with open(commands_file, 'w') as f:
-            f.write('{"invalid": json}')  # Malformed JSON
-        
-        env = os.environ.copy()
-        env['HOME'] = tmp_dir
-        
-        test_cmd = f'cd {tmp_dir} && python3 {os.getcwd()}/ql.py'
-        stdout, stderr, code = run_command(f"echo 'quit' | {test_cmd}")
-        
+        shutil.copyfile(_FIXTURES / 'malformed.json', commands_file)
+        result = await arun_command(_QL_ARGV, stdin=b"quit\n", cwd=tmp_dir, env=env)
+
         # Should handle malformed JSON gracefully
-        assert code == 0 or "quit" in stdout or "TIMEOUT" in stderr, f"Malformed JSON handling failed: {stderr}"
+        assert ok(result), f"Malformed JSON handling failed: {result.stderr.decode(errors='replace')}"
         
         print("✅ File operations tests passed")
 
-def test_interactive_mode():
+async def test_interactive_mode():
     """Test interactive mode with various inputs"""
     print("🧪 Testing interactive mode...")
     
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        config_dir = Path(tmp_dir) / '.local' / 'bin'
-        config_dir.mkdir(parents=True)
-        
-        env = os.environ.copy()
-        env['HOME'] = tmp_dir
-        
+    with test_sandbox() as (tmp_dir, env):
         # Test various interactive inputs
         test_inputs = [
-            'help\nq\n',  # Help then quit
-            'quit\n',     # Direct quit
-            '/filter\nq\n',  # Filter mode then quit
-            'p\nq\n',     # Toggle preview then quit
+            b'help\nq\n',  # Help then quit
+            b'quit\n',     # Direct quit
+            b'/filter\nq\n',  # Filter mode then quit
+            b'p\nq\n',     # Toggle preview then quit
         ]
         
-        for input_seq in test_inputs:
-            test_cmd = f'cd {tmp_dir} && python3 {os.getcwd()}/ql.py'
-            stdout, stderr, code = run_command(f"echo -e '{input_seq}' | {test_cmd}")
-            
+        # The four runs are independent, so launch them together and let
+        # the event loop overlap their subprocess latency
+        results = await asyncio.gather(
+            *(arun_command(_QL_ARGV, stdin=input_seq, cwd=tmp_dir, env=env)
+              for input_seq in test_inputs))
+
+        for result in results:
             # Should handle all inputs gracefully
-            assert code == 0 or "quit" in stdout or "Goodbye" in stdout or "TIMEOUT" in stderr, f"Interactive input failed: {stderr}"
-            assert "RangeError" not in stderr and "Invalid string length" not in stderr, "String length error in interactive mode"
+            assert ok(result) or b"Goodbye" in result.stdout, f"Interactive input failed: {result.stderr.decode(errors='replace')}"
+            assert b"RangeError" not in result.stderr and b"Invalid string length" not in result.stderr, "String length error in interactive mode"
         
         print("✅ Interactive mode tests passed")
 
-def test_cleanup_operations():
+async def test_cleanup_operations():
     """Test cleanup and temporary file handling"""
     print("🧪 Testing cleanup operations...")
     
-    with tempfile.TemporaryDirectory() as tmp_dir:
+    with test_sandbox() as (tmp_dir, env):
         config_dir = Path(tmp_dir) / '.local' / 'bin'
-        config_dir.mkdir(parents=True)
-        
+
         # Create some fake temporary scripts
         tmp_dir_path = config_dir / 'tmp'
         tmp_dir_path.mkdir(exist_ok=True)
         
         fake_script = tmp_dir_path / 'test_ql.sh'
-        with open(fake_script, 'w') as f:
-            f.write('#!/bin/bash\n# QL Command Executor\necho "test"\n')
-        
-        env = os.environ.copy()
-        env['HOME'] = tmp_dir
-        
-        test_cmd = f'cd {tmp_dir} && python3 {os.getcwd()}/ql.py'
-        stdout, stderr, code = run_command(f"echo 'cleanup\nq' | {test_cmd}")
-        
+        fake_script.write_text('#!/bin/bash\n# QL Command Executor\necho "test"\n')
+        result = await arun_command(_QL_ARGV, stdin=b"cleanup\nq\n", cwd=tmp_dir, env=env)
+
         # Should handle cleanup without errors
-        assert code == 0 or "quit" in stdout or "TIMEOUT" in stderr, f"Cleanup failed: {stderr}"
+        assert ok(result), f"Cleanup failed: {result.stderr.decode(errors='replace')}"
         
         print("✅ Cleanup operations tests passed")
 
+async def _run_all():
+    """Run every test concurrently, capped at one task per core.
+
+    The tests are isolated in their own sandboxes, so nothing stops
+    them overlapping; the semaphore just keeps a wide gather from
+    oversubscribing the machine with interpreter startups.
+    """
+    sem = asyncio.Semaphore(os.cpu_count() or 2)
+
+    async def _bounded(test):
+        async with sem:
+            await test()
+
+    await asyncio.gather(
+        _bounded(test_basic_functionality),
+        _bounded(test_command_operations),
+        _bounded(test_template_operations),
+        _bounded(test_edge_cases),
+        _bounded(test_file_operations),
+        _bounded(test_interactive_mode),
+        _bounded(test_cleanup_operations),
+    )
+
 def main():
     """Run all tests"""
     print("🚀 Starting comprehensive QL testing...")
     print("=" * 50)
-    
+
     try:
-        test_basic_functionality()
-        test_command_operations()
-        test_template_operations()
-        test_edge_cases()
-        test_file_operations()
-        test_interactive_mode()
-        test_cleanup_operations()
-        
+        # Compile once up front so every child finds a fresh .pyc (and a
+        # syntax error fails the suite immediately instead of seven times)
+        py_compile.compile(_QL_PATH, doraise=True)
+
+        asyncio.run(_run_all())
+
         print("=" * 50)
         print("🎉 ALL TESTS PASSED! QL is working correctly.")
         return 0